@@ -0,0 +1,84 @@
+"""
+## Adaptive sorts benchmark
+
+### Description
+Times the sorts on inputs of increasing disorder. Every input starts sorted and then has a
+fraction of its positions swapped with random partners; the table reports the resulting
+number of inversions next to the time of every sort.
+
+### Usage
+```
+python -m benchmarks.bench_adaptive_sorts --size 5000 --disorder 0 0.001 0.01 0.1 1
+```
+"""
+
+import argparse
+import random
+from time import perf_counter
+from typing import List
+
+from sorts.bubble_sort import bubble_sort, cocktail_sort
+from sorts.insertion_sort import binary_insertion_sort, insertion_sort
+from sorts.merge_sort import merge_sort, natural_merge_sort
+
+
+SORTS = [bubble_sort, cocktail_sort, insertion_sort, binary_insertion_sort, merge_sort, natural_merge_sort]
+
+
+def presorted(n: int, disorder: float) -> List[int]:
+    """Return range(n) with round(disorder * n) random transpositions applied."""
+    arr = list(range(n))
+    for _ in range(round(disorder * n)):
+        i, j = random.randrange(n), random.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+def count_inversions(arr: List[int]) -> int:
+    """Count the pairs i < j with arr[i] > arr[j] using a bottom-up merge sort."""
+    runs = [[x] for x in arr]
+    inversions = 0
+    while len(runs) > 1:
+        merged = []
+        for k in range(0, len(runs) - 1, 2):
+            left, right = runs[k], runs[k + 1]
+            out = []
+            i = j = 0
+            while i < len(left) and j < len(right):
+                if right[j] < left[i]:
+                    inversions += len(left) - i
+                    out.append(right[j])
+                    j += 1
+                else:
+                    out.append(left[i])
+                    i += 1
+            out += left[i:]
+            out += right[j:]
+            merged.append(out)
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return inversions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--disorder", type=float, nargs="+", default=[0, 0.001, 0.01, 0.1, 1])
+    args = parser.parse_args()
+
+    names = [sort.__name__ for sort in SORTS]
+    print(f"n={args.size}")
+    print(f"{'disorder':>9} {'inversions':>11} " + " ".join(f"{name:>21}" for name in names))
+    for disorder in args.disorder:
+        data = presorted(args.size, disorder)
+        timings = []
+        for sort in SORTS:
+            start = perf_counter()
+            sort(data)
+            timings.append(perf_counter() - start)
+        print(f"{disorder:>9} {count_inversions(data):>11} " + " ".join(f"{t:>20.4f}s" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+## Concurrent map benchmark
+
+### Description
+Runs worker threads doing a mix of lookups and updates at several read ratios, once on a
+Map guarded by a lock around every operation and once on a ConcurrentMap, whose readers take
+no lock. Then inserts sorted keys into both maps, which degrades Map to a linked list.
+Reports operations per second.
+
+### Usage
+```
+python -m benchmarks.bench_concurrent_map --threads 8 --size 100000 --operations 400000
+```
+"""
+
+import argparse
+import random
+import threading
+from time import perf_counter
+from typing import Any, List, Tuple
+
+from dictionary.concurrent_map import ConcurrentMap
+from dictionary.dictionary import Map
+
+
+class LockedMap(Map):
+    """A Map with a lock around every operation."""
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: Any) -> Any:
+        with self._lock:
+            return super().__getitem__(key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+
+
+def run(m, threads: int, work: List[List[Tuple[bool, int]]]) -> float:
+    def worker(operations: List[Tuple[bool, int]]) -> None:
+        for is_read, key in operations:
+            if is_read:
+                m[key]
+            else:
+                m[key] = key
+
+    pool = [threading.Thread(target=worker, args=(work[i],)) for i in range(threads)]
+    start = perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--size", type=int, default=50_000)
+    parser.add_argument("--operations", type=int, default=200_000)
+    parser.add_argument("--read-ratios", type=float, nargs="+", default=[0.5, 0.9, 0.99])
+    parser.add_argument("--sorted-size", type=int, default=900)
+    args = parser.parse_args()
+
+    keys = random.sample(range(args.size * 10), args.size)
+    print(f"{args.threads} threads, {args.size} keys, {args.operations} operations")
+    for read_ratio in args.read_ratios:
+        operations = [(random.random() < read_ratio, random.choice(keys)) for _ in range(args.operations)]
+        work = [operations[i::args.threads] for i in range(args.threads)]
+        rates = []
+        for m in (LockedMap(), ConcurrentMap()):
+            for key in keys:
+                m[key] = key
+            rates.append(args.operations / run(m, args.threads, work))
+        print(f"reads {read_ratio:5.0%}: locked Map {rates[0]:12,.0f} ops/s"
+              f"  ConcurrentMap {rates[1]:12,.0f} ops/s  ({rates[1] / rates[0]:.2f}x)")
+
+    # Map recurses once per level, so it raises a RecursionError from about 1000 sorted keys.
+    rates = []
+    for m in (Map(), ConcurrentMap()):
+        start = perf_counter()
+        try:
+            for key in range(args.sorted_size):
+                m[key] = key
+            for key in range(args.sorted_size):
+                m[key]
+        except RecursionError:
+            print(f"sorted keys ({args.sorted_size}): {type(m).__name__} raised RecursionError")
+            return
+        rates.append(2 * args.sorted_size / (perf_counter() - start))
+    print(f"sorted keys ({args.sorted_size}): Map {rates[0]:12,.0f} ops/s"
+          f"  ConcurrentMap {rates[1]:12,.0f} ops/s  ({rates[1] / rates[0]:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
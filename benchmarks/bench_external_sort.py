@@ -0,0 +1,61 @@
+"""
+## External sort benchmark
+
+### Description
+Writes a file of random int64 records, sorts it with external_sort and reports the
+throughput in MB/s and the peak resident set size of the process.
+
+### Usage
+```
+python -m benchmarks.bench_external_sort --size-mb 2048 --memory-limit-mb 256
+```
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+from array import array
+from time import perf_counter
+
+from sorts.external_sort import external_sort
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--memory-limit-mb", type=int, default=16)
+    parser.add_argument("--dir", default=None, help="directory for the input, output and run files")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        source = os.path.join(tmp, "input.bin")
+        target = os.path.join(tmp, "output.bin")
+        records = args.size_mb * 1024 * 1024 // 8
+        with open(source, "wb") as f:
+            for start in range(0, records, 1 << 20):
+                count = min(1 << 20, records - start)
+                array("q", (random.getrandbits(63) for _ in range(count))).tofile(f)
+
+        rss_before = peak_rss_mb()
+        start = perf_counter()
+        external_sort(source, target, "<q", memory_limit=args.memory_limit_mb * 1024 * 1024)
+        elapsed = perf_counter() - start
+
+        size_mb = os.path.getsize(source) / (1024 * 1024)
+        print(f"{size_mb:.0f} MB, memory limit {args.memory_limit_mb} MB")
+        print(f"  time:       {elapsed:.2f}s")
+        print(f"  throughput: {size_mb / elapsed:.2f} MB/s")
+        print(f"  peak RSS:   {peak_rss_mb():.1f} MB (before sort: {rss_before:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+## Graph benchmark
+
+### Description
+Builds a random undirected graph with --nodes nodes and --edges edges in CSR form, and a
+random DAG of the same size, then times the graph algorithms on them: BFS, DFS, connected
+components, Dijkstra, Prim, Kruskal and topological sort. Reports the build time, the size
+of the CSR arrays and the time of every algorithm.
+
+### Usage
+```
+python -m benchmarks.bench_graph --nodes 1000000 --edges 10000000
+```
+"""
+
+import argparse
+import random
+from array import array
+from time import perf_counter
+
+from graph.algorithms import bfs, connected_components, dfs, dijkstra, kruskal, prim, topological_sort
+from graph.graph import Graph
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def random_edges(nodes: int, edges: int, seed: int) -> tuple:
+    if np is not None:
+        rng = np.random.default_rng(seed)
+        return (rng.integers(0, nodes, edges), rng.integers(0, nodes, edges),
+                rng.integers(1, 100, edges).astype(np.float64))
+    rng = random.Random(seed)
+    return (array("q", (rng.randrange(nodes) for _ in range(edges))),
+            array("q", (rng.randrange(nodes) for _ in range(edges))),
+            array("d", (rng.randrange(1, 100) for _ in range(edges))))
+
+
+def timed(label: str, func, *args):
+    start = perf_counter()
+    result = func(*args)
+    print(f"{label:22} {perf_counter() - start:8.2f}s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sources, targets, weights = random_edges(args.nodes, args.edges, args.seed)
+    print(f"{args.nodes} nodes, {args.edges} edges{'' if np is not None else ' (without numpy)'}")
+
+    graph = timed("build (undirected)", Graph.from_edges, args.nodes, sources, targets, weights, False)
+    size = sum(column.itemsize * len(column) for column in (graph.offsets, graph.targets, graph.weights))
+    print(f"{'CSR arrays':22} {size / 2 ** 20:8.1f} MiB")
+
+    print(f"{'':22} {len(timed('bfs', bfs, graph, 0)):,} nodes reached")
+    timed("dfs", dfs, graph, 0)
+    labels = timed("connected components", connected_components, graph)
+    print(f"{'':22} {max(labels) + 1:,} components")
+    timed("dijkstra", dijkstra, graph, 0)
+    prim_forest = timed("prim", prim, graph)
+    kruskal_forest = timed("kruskal", kruskal, graph)
+    print(f"{'':22} spanning forest weight {sum(w for _, _, w in prim_forest):,.0f}"
+          f" (prim) / {sum(w for _, _, w in kruskal_forest):,.0f} (kruskal)")
+
+    # Orient every edge from the smaller to the larger node to get a DAG.
+    if np is not None:
+        keep = sources != targets
+        dag_sources = np.minimum(sources, targets)[keep]
+        dag_targets = np.maximum(sources, targets)[keep]
+    else:
+        pairs = [(min(u, v), max(u, v)) for u, v in zip(sources, targets) if u != v]
+        dag_sources, dag_targets = array("q", (u for u, _ in pairs)), array("q", (v for _, v in pairs))
+    dag = timed("build (DAG)", Graph.from_edges, args.nodes, dag_sources, dag_targets)
+    timed("topological sort", topological_sort, dag)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+## Ledger benchmark
+
+### Description
+Loads one account with many transactions, through the list-based Account and through the
+columnar LedgerAccount, then times "balance as of time t" and time-window queries.
+
+### Usage
+```
+python -m benchmarks.bench_ledger --size 10000000
+```
+"""
+
+import argparse
+import random
+import tracemalloc
+from decimal import Decimal
+from time import perf_counter
+
+from object_oriented_programming.account import Account
+from object_oriented_programming.ledger import LedgerAccount
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=10_000)
+    args = parser.parse_args()
+
+    amounts = [Decimal(random.randrange(1, 10_000)) / 100 for _ in range(args.size)]
+    dates = list(range(args.size))
+    print(f"{args.size} deposits")
+
+    tracemalloc.start()
+    start = perf_counter()
+    account = Account("list")
+    for amount in amounts:
+        account.deposit(amount)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  Account.deposit loop:        {elapsed:.3f}s  peak {peak / 2**20:.1f} MB")
+    del account
+
+    tracemalloc.start()
+    start = perf_counter()
+    ledger = LedgerAccount("ledger")
+    ledger.deposit_many(amounts, dates=dates)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  LedgerAccount.deposit_many:  {elapsed:.3f}s  peak {peak / 2**20:.1f} MB")
+
+    points = [random.randrange(args.size) for _ in range(args.queries)]
+    start = perf_counter()
+    for t in points:
+        ledger.balance_at(t)
+    elapsed = perf_counter() - start
+    print(f"  {args.queries} balance_at queries:  {elapsed * 1e6 / args.queries:.2f}us each")
+
+    start = perf_counter()
+    for t in points:
+        ledger.log.indices_between(t, t + 100)
+    elapsed = perf_counter() - start
+    print(f"  {args.queries} window lookups:    {elapsed * 1e6 / args.queries:.2f}us each")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+## Parallel sort benchmark
+
+### Description
+Measures the speedup of parallel_sort over the serial merge sort for an increasing
+number of worker processes.
+
+### Usage
+```
+python -m benchmarks.bench_parallel_sort --size 10000000 --workers 1 2 4 8 16
+```
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from sorts.merge_sort import merge_sort
+from sorts.parallel_sort import parallel_sort
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    data = [random.random() for _ in range(args.size)]
+
+    start = perf_counter()
+    expected = merge_sort(data)
+    serial = perf_counter() - start
+    print(f"n={args.size}")
+    print(f"  serial merge_sort: {serial:.3f}s")
+
+    for workers in args.workers:
+        start = perf_counter()
+        result = parallel_sort(data, workers=workers)
+        elapsed = perf_counter() - start
+        assert result == expected
+        print(f"  workers={workers:<3} {elapsed:.3f}s  speedup {serial / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+## Persistent structures benchmark
+
+### Description
+Builds a map of --size random keys, then keeps --versions versions, each one update after
+the previous one. It does this with PersistentMap, which shares the unchanged nodes, and
+with deep copies of Map, which are measured on --copy-versions copies and extrapolated.
+Then it does the same with PersistentBinarySearchTree inserts.
+Reports the memory held by the retained versions (tracemalloc) and the time to diff the
+first and the last version.
+
+### Usage
+```
+python -m benchmarks.bench_persistent --size 100000 --versions 1000
+```
+"""
+
+import argparse
+import copy
+import random
+import tracemalloc
+from time import perf_counter
+
+from binary_search_tree.persistent_binary_search_tree import PersistentBinarySearchTree
+from dictionary.dictionary import Map
+from dictionary.persistent_map import PersistentMap
+
+
+def retained(build) -> tuple:
+    """Return the result of build() and the bytes it still holds."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--versions", type=int, default=1_000)
+    parser.add_argument("--copy-versions", type=int, default=10)
+    args = parser.parse_args()
+
+    keys = random.sample(range(args.size * 10), args.size)
+    updates = [(random.choice(keys), random.random()) for _ in range(args.versions)]
+
+    base = PersistentMap()
+    for key in keys:
+        base = base.set(key, 0.0)
+
+    def persistent_versions() -> list:
+        versions = [base]
+        for key, value in updates:
+            versions.append(versions[-1].set(key, value))
+        return versions
+
+    versions, persistent_bytes = retained(persistent_versions)
+
+    mutable = Map()
+    for key in keys:
+        mutable[key] = 0.0
+
+    def copied_versions() -> list:
+        copies = []
+        for key, value in updates[:args.copy_versions]:
+            mutable[key] = value
+            copies.append(copy.deepcopy(mutable))
+        return copies
+
+    _, copy_bytes = retained(copied_versions)
+    copy_bytes = copy_bytes / args.copy_versions * args.versions
+
+    start = perf_counter()
+    changes = sum(1 for _ in versions[0].diff(versions[-1]))
+    diff_time = perf_counter() - start
+
+    print(f"{args.size} keys, {args.versions} versions")
+    print(f"PersistentMap:  {persistent_bytes / 2 ** 20:10.1f} MiB"
+          f"  ({persistent_bytes / args.versions:,.0f} bytes per version)")
+    print(f"Map deep copies: {copy_bytes / 2 ** 20:9.1f} MiB (extrapolated from {args.copy_versions} copies)")
+    print(f"diff of first and last version: {changes} changes in {diff_time * 1000:.2f} ms")
+
+    values = random.sample(range(args.size * 10), args.size)
+    tree = PersistentBinarySearchTree()
+    for value in values:
+        tree = tree.insert(value)
+
+    def tree_versions() -> list:
+        trees = [tree]
+        for value in random.sample(range(args.size * 10), args.versions):
+            trees.append(trees[-1].insert(value))
+        return trees
+
+    trees, tree_bytes = retained(tree_versions)
+    start = perf_counter()
+    removed, added = trees[0].diff(trees[-1])
+    diff_time = perf_counter() - start
+    print(f"PersistentBinarySearchTree: {tree_bytes / 2 ** 20:.1f} MiB"
+          f"  ({tree_bytes / args.versions:,.0f} bytes per version),"
+          f" diff: {len(added)} added in {diff_time * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+## Shape batch benchmark
+
+### Description
+Computes the total area and perimeter of a mix of random shapes, once by creating a Shape
+object per shape with shape_factory and once with a columnar ShapeBatch.
+
+### Usage
+```
+python -m benchmarks.bench_shape_batch --size 1000000
+```
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from object_oriented_programming.shape_batch import ShapeBatch, np
+from object_oriented_programming.shapes import shape_factory
+
+
+def random_spec():
+    kind = random.choice(("circle", "rectangle", "square", "triangle"))
+    if kind == "circle":
+        return kind, random.uniform(0.1, 10)
+    if kind == "rectangle":
+        return kind, random.uniform(0.1, 10), random.uniform(0.1, 10)
+    if kind == "square":
+        return kind, random.uniform(0.1, 10)
+    a, b = random.uniform(1, 10), random.uniform(1, 10)
+    return kind, a, b, random.uniform(abs(a - b) + 0.01, a + b - 0.01)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    specs = [random_spec() for _ in range(args.size)]
+    print(f"{args.size} shapes, backend: {'numpy' if np is not None else 'array'}")
+
+    start = perf_counter()
+    shapes = [shape_factory(*spec) for spec in specs]
+    area = sum(shape.area() for shape in shapes)
+    perimeter = sum(shape.perimeter() for shape in shapes)
+    print(f"  per-object: {perf_counter() - start:.3f}s")
+
+    start = perf_counter()
+    batch = ShapeBatch.from_specs(specs)
+    built = perf_counter() - start
+    batch_area = batch.total_area()
+    batch_perimeter = batch.total_perimeter()
+    elapsed = perf_counter() - start
+    print(f"  ShapeBatch: {elapsed:.3f}s ({built:.3f}s building from specs, {elapsed - built:.3f}s computing)")
+
+    assert abs(area - batch_area) <= 1e-9 * area
+    assert abs(perimeter - batch_perimeter) <= 1e-9 * perimeter
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+## Shapes benchmark
+
+### Description
+Creates shapes one by one with shape_factory and in bulk with create_many, then evaluates
+area() and perimeter() twice to show the cost of the first (computed) and second (cached) call.
+
+### Usage
+```
+python -m benchmarks.bench_shapes --size 10000000
+```
+"""
+
+import argparse
+import random
+import sys
+from time import perf_counter
+
+from object_oriented_programming.shapes import create_many, shape_factory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    kinds = [("circle", 1.5), ("rectangle", 2.0, 3.0), ("square", 2.0), ("triangle", 3.0, 4.0, 5.0)]
+    specs = [random.choice(kinds) for _ in range(args.size)]
+    print(f"{args.size} shapes")
+
+    start = perf_counter()
+    shapes = [shape_factory(*spec) for spec in specs]
+    print(f"  shape_factory loop:  {perf_counter() - start:.3f}s")
+    del shapes
+
+    start = perf_counter()
+    shapes = create_many(specs)
+    print(f"  create_many:         {perf_counter() - start:.3f}s")
+    print(f"  size of one Circle:  {sys.getsizeof(shapes[specs.index(kinds[0])])} bytes, no __dict__")
+
+    for label in ("first", "cached"):
+        start = perf_counter()
+        for shape in shapes:
+            shape.area()
+            shape.perimeter()
+        print(f"  evaluate ({label}): {perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
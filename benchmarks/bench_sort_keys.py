@@ -0,0 +1,63 @@
+"""
+## Sort keys benchmark
+
+### Description
+Sorts records by a (category, score) tuple, once with a key function and once with the
+equivalent less-than comparator wrapped by less_to_key, and reports the speedup.
+
+### Usage
+```
+python -m benchmarks.bench_sort_keys --size 1000000
+```
+"""
+
+import argparse
+import random
+from time import perf_counter
+from typing import NamedTuple
+
+from sorts.keys import less_to_key
+from sorts.merge_sort import merge_sort
+from sorts.quick_sort import quick_sort
+
+
+class Record(NamedTuple):
+    category: str
+    score: int
+    name: str
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=200_000)
+    args = parser.parse_args()
+
+    categories = [f"category-{i}" for i in range(100)]
+    records = [
+        Record(random.choice(categories), random.randrange(1_000_000), f"record-{i}")
+        for i in range(args.size)
+    ]
+
+    def by_key(r: Record):
+        return (r.category, r.score)
+
+    def less(x: Record, y: Record) -> bool:
+        return (x.category, x.score) < (y.category, y.score)
+
+    print(f"n={args.size}, key=(category, score)")
+    for sort in (merge_sort, quick_sort):
+        start = perf_counter()
+        expected = sort(records, key=less_to_key(less))
+        comparator = perf_counter() - start
+
+        start = perf_counter()
+        result = sort(records, key=by_key)
+        extractor = perf_counter() - start
+
+        assert result == expected
+        print(f"  {sort.__name__:<11} comparator {comparator:.3f}s  key {extractor:.3f}s  "
+              f"speedup {comparator / extractor:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+## Spatial index benchmark
+
+### Description
+Bulk-loads an R-tree over random positioned shapes and times window queries, nearest-neighbor
+queries and the all-pairs overlap search, next to brute-force scans over a sample.
+
+### Usage
+```
+python -m benchmarks.bench_spatial_index --size 1000000
+```
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from object_oriented_programming.shapes import Circle, Rectangle, Square, Triangle
+from object_oriented_programming.spatial_index import BoundingBox, PositionedShape, RTree
+
+
+def random_shape(extent: float) -> PositionedShape:
+    kind = random.randrange(4)
+    if kind == 0:
+        shape = Circle(random.uniform(0.1, 1))
+    elif kind == 1:
+        shape = Rectangle(random.uniform(0.1, 2), random.uniform(0.1, 2))
+    elif kind == 2:
+        shape = Square(random.uniform(0.1, 1.5))
+    else:
+        scale = random.uniform(0.05, 0.4)
+        shape = Triangle(3 * scale, 4 * scale, 5 * scale)
+    return PositionedShape(shape, random.uniform(0, extent), random.uniform(0, extent))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=1_000)
+    parser.add_argument("--brute-force-size", type=int, default=2_000)
+    args = parser.parse_args()
+
+    # Keep the density constant: about one shape per 4 square units.
+    extent = (4 * args.size) ** 0.5
+    items = [random_shape(extent) for _ in range(args.size)]
+    print(f"{args.size} shapes on a {extent:.0f} x {extent:.0f} plane")
+
+    start = perf_counter()
+    tree = RTree(items)
+    print(f"  STR bulk load:          {perf_counter() - start:.3f}s")
+
+    windows = []
+    for _ in range(args.queries):
+        x, y = random.uniform(0, extent), random.uniform(0, extent)
+        windows.append(BoundingBox(x, y, x + 10, y + 10))
+
+    start = perf_counter()
+    found = sum(len(tree.query(window)) for window in windows)
+    elapsed = perf_counter() - start
+    print(f"  window query:           {elapsed * 1e6 / args.queries:.1f}us each ({found / args.queries:.1f} hits)")
+
+    start = perf_counter()
+    for window in windows[:10]:
+        [item for item in items if item.bbox.intersects(window)]
+    print(f"  brute-force window:     {(perf_counter() - start) * 1e6 / 10:.1f}us each")
+
+    start = perf_counter()
+    for window in windows:
+        tree.nearest(window.min_x, window.min_y, k=10)
+    print(f"  10-nearest query:       {(perf_counter() - start) * 1e6 / args.queries:.1f}us each")
+
+    start = perf_counter()
+    pairs = sum(1 for _ in tree.overlapping_pairs())
+    print(f"  all overlapping pairs:  {perf_counter() - start:.3f}s ({pairs} pairs)")
+
+    sample = items[:args.brute_force_size]
+    start = perf_counter()
+    for i in range(len(sample)):
+        for j in range(i + 1, len(sample)):
+            sample[i].bbox.intersects(sample[j].bbox)
+    elapsed = perf_counter() - start
+    print(f"  brute-force pairs:      {elapsed:.3f}s for {len(sample)} shapes "
+          f"(~{elapsed * (args.size / len(sample)) ** 2:.0f}s extrapolated to {args.size})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+## Transfer engine benchmark
+
+### Description
+Runs many worker threads that move money between accounts chosen with a skewed (Zipf-like)
+distribution, once with one locked transfer at a time and once with netted batches.
+Reports throughput, lock acquisitions and checks that no money was created or lost.
+
+### Usage
+```
+python -m benchmarks.bench_transfers --threads 16 --transfers 200000 --accounts 1000
+```
+"""
+
+import argparse
+import random
+import threading
+from decimal import Decimal
+from time import perf_counter
+from typing import List
+
+from object_oriented_programming.account import Account
+from object_oriented_programming.transfer_engine import Transfer, TransferEngine
+
+
+def skewed_transfers(accounts: List[Account], count: int, skew: float) -> List[Transfer]:
+    weights = [1 / (rank + 1) ** skew for rank in range(len(accounts))]
+    transfers = []
+    while len(transfers) < count:
+        source, destination = random.choices(accounts, weights, k=2)
+        if source is not destination:
+            transfers.append(Transfer(Decimal(random.randrange(1, 10)), source, destination))
+    return transfers
+
+
+def run(threads: int, work: List[List[Transfer]], batch_size: int, engine: TransferEngine) -> float:
+    def worker(transfers: List[Transfer]) -> None:
+        for i in range(0, len(transfers), batch_size):
+            batch = transfers[i:i + batch_size]
+            try:
+                if batch_size == 1:
+                    engine.transfer(batch[0].amount, batch[0].source, batch[0].destination)
+                else:
+                    engine.settle(batch)
+            except ValueError:
+                pass
+
+    pool = [threading.Thread(target=worker, args=(work[i],)) for i in range(threads)]
+    start = perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--transfers", type=int, default=100_000)
+    parser.add_argument("--accounts", type=int, default=1_000)
+    parser.add_argument("--skew", type=float, default=1.2)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    print(f"{args.threads} threads, {args.transfers} transfers, {args.accounts} accounts, skew {args.skew}")
+    for batch_size in (1, args.batch_size):
+        accounts = [Account(f"account-{i}", Decimal(1_000)) for i in range(args.accounts)]
+        total = sum(account.balance for account in accounts)
+        transfers = skewed_transfers(accounts, args.transfers, args.skew)
+        work = [transfers[i::args.threads] for i in range(args.threads)]
+
+        if batch_size == 1:
+            locks = 2 * len(transfers)
+        else:
+            locks = sum(
+                len({a.id for t in chunk[i:i + batch_size] for a in (t.source, t.destination)})
+                for chunk in work for i in range(0, len(chunk), batch_size)
+            )
+
+        elapsed = run(args.threads, work, batch_size, TransferEngine())
+        assert sum(account.balance for account in accounts) == total
+        mode = "single transfers" if batch_size == 1 else f"batches of {batch_size}"
+        print(f"  {mode:<17} {len(transfers) / elapsed:>10.0f} transfers/s  {locks:>8} lock acquisitions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+## Vectorized sorts benchmark
+
+### Description
+Compares the pure-Python counting sort with the NumPy counting and radix sorts,
+and the batched row sort with sorting every row separately.
+
+### Usage
+```
+python -m benchmarks.bench_vectorized_sorts --size 1000000
+```
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+import numpy as np
+
+from sorts.counting_sort import counting_sort
+from sorts import vectorized
+
+
+def timed(func, *args) -> float:
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--key-range", type=int, default=1 << 20)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--row-length", type=int, default=16)
+    args = parser.parse_args()
+
+    data = [random.randrange(args.key_range) for _ in range(args.size)]
+    array = np.array(data, dtype=np.int64)
+    print(f"n={args.size}, keys in [0, {args.key_range})")
+    print(f"  counting_sort (pure Python): {timed(counting_sort, data):.3f}s")
+    print(f"  vectorized.counting_sort:    {timed(vectorized.counting_sort, array):.3f}s")
+    print(f"  vectorized.radix_sort:       {timed(vectorized.radix_sort, array):.3f}s")
+    print(f"  vectorized.radix_argsort:    {timed(vectorized.radix_argsort, array):.3f}s")
+
+    block = np.random.randint(0, args.key_range, size=(args.rows, args.row_length))
+    rows = block.tolist()
+    print(f"{args.rows} rows of {args.row_length}")
+    print(f"  sorted() per row:            {timed(lambda: [sorted(row) for row in rows]):.3f}s")
+    print(f"  vectorized.batched_sort:     {timed(vectorized.batched_sort, block):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
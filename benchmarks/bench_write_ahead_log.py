@@ -0,0 +1,73 @@
+"""
+## Write-ahead log benchmark
+
+### Description
+Logs deposits and transfers with different group commit sizes, then measures recovery time
+from the log alone and from a snapshot taken shortly before the end of the log.
+
+### Usage
+```
+python -m benchmarks.bench_write_ahead_log --operations 1000000 --accounts 1000
+```
+"""
+
+import argparse
+import random
+import tempfile
+from decimal import Decimal
+from time import perf_counter
+
+from object_oriented_programming.write_ahead_log import DurableLedger
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--operations", type=int, default=100_000)
+    parser.add_argument("--accounts", type=int, default=100)
+    parser.add_argument("--group-commit", type=int, nargs="+", default=[1, 64, 4096])
+    parser.add_argument("--tail", type=float, default=0.01, help="fraction of the log written after the snapshot")
+    args = parser.parse_args()
+
+    owners = [f"account-{i}" for i in range(args.accounts)]
+    print(f"{args.operations} operations over {args.accounts} accounts")
+    for group_commit in args.group_commit:
+        with tempfile.TemporaryDirectory() as directory:
+            ledger = DurableLedger(directory, group_commit=group_commit)
+            for owner in owners:
+                ledger.open_account(owner, Decimal(1_000_000))
+
+            snapshot_at = int(args.operations * (1 - args.tail))
+            start = perf_counter()
+            for i in range(args.operations):
+                if i == snapshot_at:
+                    ledger.snapshot()
+                if i % 2:
+                    ledger.deposit(random.choice(owners), Decimal(random.randrange(1, 100)))
+                else:
+                    source, destination = random.sample(owners, 2)
+                    ledger.transfer(Decimal(1), source, destination)
+            ledger.close()
+            elapsed = perf_counter() - start
+            print(f"  group_commit={group_commit:<5} {args.operations / elapsed:>10.0f} ops/s")
+
+            start = perf_counter()
+            recovered = DurableLedger(directory)
+            elapsed = perf_counter() - start
+            recovered.close()
+            print(f"    recovery from snapshot + {args.tail:.0%} tail: {elapsed:.3f}s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        ledger = DurableLedger(directory, group_commit=4096)
+        for owner in owners:
+            ledger.open_account(owner, Decimal(1_000_000))
+        for _ in range(args.operations):
+            ledger.deposit(random.choice(owners), Decimal(1))
+        ledger.close()
+
+        start = perf_counter()
+        DurableLedger(directory).close()
+        print(f"  recovery replaying the whole log: {perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
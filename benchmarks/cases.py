@@ -0,0 +1,179 @@
+"""
+## Benchmark cases
+
+### Description
+The workloads run by the benchmark suite. A case takes an input list of ints and runs one
+workload on it: a sort of the list, or a fixed sequence of operations on a data structure.
+
+Comparisons are counted by running the workload a second time on Counted wrappers, which
+count every rich comparison made on them. Cases whose structures index with the values
+(counting sort, union-find) report no comparison count.
+
+Quadratic workloads cap their input size with max_size, so a suite run with large sizes
+skips them instead of running for hours. That includes quick sort, which is quadratic on the
+adversarial (organ pipe) input.
+
+The parallel, external and vectorized sorts only take plain ints, so they report no comparison
+count. The peak memory of parallel sort leaves out its worker processes, and that of external
+sort its files on disk. Parallel sort only starts workers from PARALLEL_CUTOFF (65536) elements;
+smaller runs time its serial fallback. The vectorized cases are only defined when NumPy is
+installed.
+"""
+
+import os
+import random
+import tempfile
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+from binary_search_tree.binary_search_tree import BinarySearchTree
+from dictionary.concurrent_map import ConcurrentMap
+from dictionary.dictionary import Map
+from heap.heap import Heap
+from linked_list.linked_list import LinkedList
+from sorts.bubble_sort import bubble_sort, cocktail_sort
+from sorts.counting_sort import counting_sort
+from sorts.external_sort import external_sort
+from sorts.insertion_sort import binary_insertion_sort, insertion_sort
+from sorts.merge_sort import merge_sort, natural_merge_sort
+from sorts.parallel_sort import parallel_sort
+from sorts.partial_sort import partial_sort
+from sorts.quick_sort import quick_sort
+from sorts.selection_sort import selection_sort
+from sorts import vectorized
+from union_find.union_find import UnionFind
+
+
+class Counted:
+    """An int wrapper that counts the comparisons made on it."""
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __lt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "Counted") -> bool:
+        Counted.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other: object) -> bool:
+        Counted.comparisons += 1
+        return isinstance(other, Counted) and self.value == other.value
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """A named workload over an input list."""
+    name: str
+    run: Callable[[List], object]
+    max_size: int = 10 ** 7
+    counts_comparisons: bool = True
+
+
+def _external_sort(data: List, memory_limit: int = 1 << 20) -> List[int]:
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "input.bin")
+        target = os.path.join(directory, "output.bin")
+        with open(source, "wb") as file:
+            array("q", data).tofile(file)
+        external_sort(source, target, "<q", memory_limit=memory_limit)
+        result = array("q")
+        with open(target, "rb") as file:
+            result.frombytes(file.read())
+    return result.tolist()
+
+
+def _heap(data: List) -> None:
+    heap = Heap()
+    for x in data:
+        heap.insert(x)
+    while len(heap):
+        heap.pop()
+
+
+def _map(data: List, map_type: type = Map) -> None:
+    m = map_type()
+    for x in data:
+        m[x] = x
+    for x in data:
+        m[x]
+    for x in data[::2]:
+        if x in m:
+            del m[x]
+
+
+def _binary_search_tree(data: List) -> None:
+    tree = BinarySearchTree()
+    for x in data:
+        tree.insert(x)
+    for x in data:
+        tree.search(x)
+
+
+def _linked_list(data: List) -> None:
+    linked_list = LinkedList()
+    for x in data:
+        linked_list.append_right(x)
+    rng = random.Random(0)
+    for _ in range(100):
+        linked_list[rng.randrange(len(data))]
+    for x in data[:100]:
+        x in linked_list
+    while len(linked_list):
+        linked_list.pop_left()
+
+
+def _union_find(data: List) -> None:
+    n = len(data)
+    union_find = UnionFind(n)
+    for i, x in enumerate(data):
+        union_find.union(i, x % n)
+    for i in range(n):
+        union_find.find(i)
+
+
+CASES: Dict[str, BenchmarkCase] = {case.name: case for case in [
+    BenchmarkCase("sorts.bubble_sort", bubble_sort, max_size=10 ** 4),
+    BenchmarkCase("sorts.cocktail_sort", cocktail_sort, max_size=10 ** 4),
+    BenchmarkCase("sorts.insertion_sort", insertion_sort, max_size=10 ** 4),
+    BenchmarkCase("sorts.binary_insertion_sort", binary_insertion_sort, max_size=10 ** 5),
+    BenchmarkCase("sorts.selection_sort", selection_sort, max_size=10 ** 4),
+    BenchmarkCase("sorts.merge_sort", merge_sort),
+    BenchmarkCase("sorts.natural_merge_sort", natural_merge_sort),
+    BenchmarkCase("sorts.quick_sort", quick_sort, max_size=10 ** 4),
+    BenchmarkCase("sorts.counting_sort", counting_sort, counts_comparisons=False),
+    BenchmarkCase("sorts.partial_sort[k=10]", lambda data: partial_sort(data, 10)),
+    BenchmarkCase("sorts.parallel_sort", parallel_sort, counts_comparisons=False),
+    BenchmarkCase("sorts.external_sort", _external_sort, max_size=10 ** 6, counts_comparisons=False),
+    BenchmarkCase("heap.Heap", _heap),
+    BenchmarkCase("dictionary.Map", _map),
+    BenchmarkCase("dictionary.ConcurrentMap", lambda data: _map(data, ConcurrentMap)),
+    BenchmarkCase("binary_search_tree.BinarySearchTree", _binary_search_tree),
+    BenchmarkCase("linked_list.LinkedList", _linked_list),
+    BenchmarkCase("union_find.UnionFind", _union_find, counts_comparisons=False),
+]}
+
+if vectorized.np is not None:
+    for case in [
+        BenchmarkCase("sorts.vectorized.counting_sort", vectorized.counting_sort, counts_comparisons=False),
+        BenchmarkCase("sorts.vectorized.radix_sort", vectorized.radix_sort, counts_comparisons=False),
+        BenchmarkCase("sorts.vectorized.argsort", vectorized.argsort, counts_comparisons=False),
+    ]:
+        CASES[case.name] = case
@@ -0,0 +1,60 @@
+"""
+## Benchmark inputs
+
+### Description
+Deterministic input generators for the benchmark suite. Every generator returns a list of
+n ints in [0, n) and uses its own seeded random generator, so a (distribution, n, seed)
+triple always produces the same input and runs can be compared with a stored baseline.
+
+### Distributions
+- random: uniformly random values.
+- sorted: 0, 1, ..., n - 1.
+- reversed: n - 1, ..., 1, 0.
+- few_unique: random values from a set of 10.
+- adversarial: an "organ pipe" 0, 1, ..., n/2, ..., 1, 0. Its middle element is always the
+  maximum, which is the worst case of the middle-pivot quick sort, and its sorted halves
+  degenerate the unbalanced binary search trees into linked lists.
+"""
+
+import random
+from typing import Callable, Dict, List
+
+
+def random_values(n: int, seed: int = 0) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def sorted_values(n: int, seed: int = 0) -> List[int]:
+    return list(range(n))
+
+
+def reversed_values(n: int, seed: int = 0) -> List[int]:
+    return list(range(n - 1, -1, -1))
+
+
+def few_unique_values(n: int, seed: int = 0) -> List[int]:
+    rng = random.Random(seed)
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def adversarial_values(n: int, seed: int = 0) -> List[int]:
+    half = (n + 1) // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+DISTRIBUTIONS: Dict[str, Callable[[int, int], List[int]]] = {
+    "random": random_values,
+    "sorted": sorted_values,
+    "reversed": reversed_values,
+    "few_unique": few_unique_values,
+    "adversarial": adversarial_values,
+}
+
+
+def generate(distribution: str, n: int, seed: int = 0) -> List[int]:
+    """Return the input of the given distribution and size."""
+    try:
+        return DISTRIBUTIONS[distribution](n, seed)
+    except KeyError:
+        raise ValueError(f"Unknown distribution {distribution!r}") from None
@@ -0,0 +1,188 @@
+"""
+## Benchmark suite
+
+### Description
+Runs every benchmark case (see benchmarks/cases.py) over a grid of input sizes and
+distributions (see benchmarks/inputs.py) and records, for each run:
+- time: the best wall-clock time of --repeat runs, in seconds.
+- comparisons: the number of element comparisons, counted on a separate run.
+- peak_memory: the peak traced allocation in bytes, measured with tracemalloc on another
+  separate run, so neither counting nor tracing slows the timed runs.
+
+Runs above a case's max_size are skipped. A run that fails (for example with a RecursionError
+in the recursive trees on sorted input) records the error instead of stopping the suite.
+
+Results are written as JSON. With --baseline the results are compared with an earlier results
+file, and every metric that grew by more than its threshold is reported as a regression; the
+command then exits with status 1, so it can gate a CI job. --save-baseline stores the results
+as the new baseline.
+
+### Usage
+```
+python -m benchmarks.run --sizes 1000 10000 --output results.json
+python -m benchmarks.run --cases sorts. --distributions random sorted --save-baseline baseline.json
+python -m benchmarks.run --baseline baseline.json --time-threshold 0.2
+```
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from benchmarks.cases import CASES, BenchmarkCase, Counted
+from benchmarks.inputs import DISTRIBUTIONS, generate
+
+METRICS = ("time", "comparisons", "peak_memory")
+
+
+def measure(case: BenchmarkCase, data: List[int], repeat: int) -> Dict[str, Optional[float]]:
+    """Return the time, comparison count and peak memory of one case on one input."""
+    time = min(_timed(case, data) for _ in range(repeat))
+
+    comparisons = None
+    if case.counts_comparisons:
+        Counted.comparisons = 0
+        case.run([Counted(x) for x in data])
+        comparisons = Counted.comparisons
+
+    data = list(data)
+    tracemalloc.start()
+    try:
+        case.run(data)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"time": time, "comparisons": comparisons, "peak_memory": peak_memory}
+
+
+def _timed(case: BenchmarkCase, data: List[int]) -> float:
+    data = list(data)
+    start = perf_counter()
+    case.run(data)
+    return perf_counter() - start
+
+
+def run_suite(cases: List[BenchmarkCase], sizes: List[int], distributions: List[str],
+              repeat: int = 3, seed: int = 0) -> List[dict]:
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            data = generate(distribution, size, seed)
+            for case in cases:
+                result = {"case": case.name, "size": size, "distribution": distribution}
+                if size > case.max_size:
+                    result["skipped"] = f"size above max_size {case.max_size}"
+                else:
+                    try:
+                        result.update(measure(case, data, repeat))
+                    except (RecursionError, MemoryError) as error:
+                        result["error"] = type(error).__name__
+                results.append(result)
+                print(_format(result), flush=True)
+    return results
+
+
+def _format(result: dict) -> str:
+    label = f"{result['case']:40} {result['distribution']:12} n={result['size']:<9}"
+    if "skipped" in result:
+        return f"{label} skipped"
+    if "error" in result:
+        return f"{label} {result['error']}"
+    comparisons = "-" if result["comparisons"] is None else result["comparisons"]
+    return (f"{label} {result['time']:9.4f}s  {comparisons:>12} cmp"
+            f"  {result['peak_memory'] / 1024:10.1f} KiB")
+
+
+def compare(results: List[dict], baseline: List[dict], thresholds: Dict[str, float],
+            min_time: float = 1e-3) -> List[str]:
+    """
+    Return a message for every metric that regressed beyond its threshold.
+    Times below min_time in the baseline are too noisy to compare and are ignored.
+    """
+    previous = {(r["case"], r["size"], r["distribution"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        key = (result["case"], result["size"], result["distribution"])
+        old = previous.get(key)
+        if old is None:
+            continue
+        if "error" in result and "error" not in old:
+            regressions.append(f"{key}: {result['error']} (passed in the baseline)")
+            continue
+        for metric in METRICS:
+            new_value, old_value = result.get(metric), old.get(metric)
+            if new_value is None or not old_value:
+                continue
+            if metric == "time" and old_value < min_time:
+                continue
+            change = new_value / old_value - 1
+            if change > thresholds[metric]:
+                regressions.append(f"{key}: {metric} {old_value:g} -> {new_value:g} (+{change:.1%})")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("###")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--distributions", nargs="+", choices=sorted(DISTRIBUTIONS),
+                        default=list(DISTRIBUTIONS))
+    parser.add_argument("--cases", nargs="+", default=[""],
+                        help="run only the cases whose names start with one of these prefixes")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare the results with this JSON file")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file as a baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.25)
+    parser.add_argument("--comparisons-threshold", type=float, default=0.0)
+    parser.add_argument("--memory-threshold", type=float, default=0.10)
+    parser.add_argument("--min-time", type=float, default=1e-3,
+                        help="ignore time regressions of runs faster than this in the baseline")
+    args = parser.parse_args()
+
+    cases = [case for name, case in CASES.items() if name.startswith(tuple(args.cases))]
+    if not cases:
+        parser.error(f"No cases match {args.cases}")
+
+    # The recursive trees recurse once per level; give them room before they raise.
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10_000))
+    results = run_suite(cases, args.sizes, args.distributions, args.repeat, args.seed)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as file:
+                json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["results"]
+        thresholds = {
+            "time": args.time_threshold,
+            "comparisons": args.comparisons_threshold,
+            "peak_memory": args.memory_threshold,
+        }
+        regressions = compare(results, baseline, thresholds, args.min_time)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+## summary:
+The module contains a persistent (immutable) binary search tree whose versions share their
+unchanged subtrees.
+
+## classes:
+- Node: An immutable node of a persistent binary search tree.
+- PersistentBinarySearchTree: A binary search tree whose insert and remove return new versions.
+
+## description:
+insert and remove never modify a tree: they copy the nodes on the path from the root to the
+changed node and share every other subtree with the original tree, so each update allocates
+O(h) nodes for a tree of height h and old versions stay valid. All operations are iterative,
+so unbalanced trees (built from sorted values) do not hit the recursion limit.
+
+snapshot() is O(1), and diff() compares two versions, skipping every subtree they share.
+"""
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    """An immutable node of a persistent binary search tree."""
+    value: int
+    left: Optional["Node"] = None
+    right: Optional["Node"] = None
+
+
+class PersistentBinarySearchTree:
+    """A binary search tree whose insert and remove return new versions."""
+
+    __slots__ = ("root", "size")
+
+    def __init__(self, root: Optional[Node] = None, size: int = 0):
+        self.root = root
+        self.size = size
+
+    def insert(self, value: int) -> "PersistentBinarySearchTree":
+        """Return a new version with the value inserted."""
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            node = node.left if value <= node.value else node.right
+
+        node = Node(value)
+        for parent in reversed(path):
+            if value <= parent.value:
+                node = Node(parent.value, node, parent.right)
+            else:
+                node = Node(parent.value, parent.left, node)
+        return PersistentBinarySearchTree(node, self.size + 1)
+
+    def remove(self, value: int) -> "PersistentBinarySearchTree":
+        """Return a new version with one occurrence of the value removed (the same tree if absent)."""
+        path = []
+        node = self.root
+        while node is not None and value != node.value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if node is None:
+            return self
+
+        if node.left is None:
+            replacement = node.right
+        elif node.right is None:
+            replacement = node.left
+        else:
+            # Replace the value with its predecessor (the largest value on the left) and copy
+            # the path down to it. Copies of the predecessor stay on its left, so every left
+            # subtree still holds the values <= its node and every right subtree the rest.
+            predecessor_path = []
+            predecessor = node.left
+            while predecessor.right is not None:
+                predecessor_path.append(predecessor)
+                predecessor = predecessor.right
+            left = predecessor.left
+            for parent in reversed(predecessor_path):
+                left = Node(parent.value, parent.left, left)
+            replacement = Node(predecessor.value, left, node.right)
+
+        for parent in reversed(path):
+            if value < parent.value:
+                replacement = Node(parent.value, replacement, parent.right)
+            else:
+                replacement = Node(parent.value, parent.left, replacement)
+        return PersistentBinarySearchTree(replacement, self.size - 1)
+
+    def search(self, value: int) -> bool:
+        """Return True if the value is in the tree, False otherwise."""
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return True
+            node = node.left if value < node.value else node.right
+        return False
+
+    def snapshot(self) -> "PersistentBinarySearchTree":
+        """Return a version that later updates cannot change: the tree itself."""
+        return self
+
+    def diff(self, other: "PersistentBinarySearchTree") -> Tuple[List[int], List[int]]:
+        """Return the values removed and the values added going from this version to the other."""
+        removed: List[int] = []
+        added: List[int] = []
+        stack = [(self.root, other.root)]
+        while stack:
+            old, new = stack.pop()
+            if old is new:
+                continue
+            if old is None:
+                added.extend(_inorder(new))
+                continue
+            if new is None:
+                removed.extend(_inorder(old))
+                continue
+
+            # Cut the new version at the old root's value; when the updates left that value at
+            # the top, split copies nothing and the unchanged sides are skipped as identical.
+            left, found, right = _split(new, old.value)
+            if not found:
+                removed.append(old.value)
+            stack.append((old.right, right))
+            stack.append((old.left, left))
+        return sorted(removed), sorted(added)
+
+    def __str__(self) -> str:
+        return str([value for value in self])
+
+    def __contains__(self, value: int) -> bool:
+        return self.search(value)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        return _inorder(self.root)
+
+
+def _inorder(node: Optional[Node]) -> Iterator[int]:
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.value
+        node = node.right
+
+
+def _split(node: Optional[Node], value: int) -> Tuple[Optional[Node], bool, Optional[Node]]:
+    """
+    Remove one occurrence of the value and return the tree of the values <= value, whether
+    the value was found and the tree of the values > value. Subtrees that are not cut are
+    shared, and if the value is at the root its own subtrees are returned.
+    """
+    path = []
+    while node is not None and node.value != value:
+        path.append(node)
+        node = node.right if node.value < value else node.left
+
+    left, right = (node.left, node.right) if node is not None else (None, None)
+    for parent in reversed(path):
+        if parent.value < value:
+            left = parent if left is parent.right else Node(parent.value, parent.left, left)
+        else:
+            right = parent if right is parent.left else Node(parent.value, right, parent.right)
+    return left, node is not None, right
+
+
+if __name__ == "__main__":
+    v1 = PersistentBinarySearchTree()
+    for value in [5, 3, 7, 2, 4, 6]:
+        v1 = v1.insert(value)
+
+    v2 = v1.remove(3).insert(8)
+    print(v1, len(v1))  # [2, 3, 4, 5, 6, 7] 6
+    print(v2, len(v2))  # [2, 4, 5, 6, 7, 8] 6
+    print(v1.diff(v2))  # ([3], [8])
+    print(v1.root.right is v2.root.right)  # False: 8 was inserted under 7
+    print(v1.root.left.right is v2.root.left.right)  # True: the subtree of 4 is shared
+
+    sorted_tree = PersistentBinarySearchTree()
+    for value in range(5000):
+        sorted_tree = sorted_tree.insert(value)
+    print(4999 in sorted_tree, len(sorted_tree))  # True 5000
@@ -0,0 +1,97 @@
+"""
+## summary:
+The module contains an ordered map that is safe to read from many threads while it is updated.
+
+## classes:
+- ConcurrentMap: A map (dictionary) backed by a persistent treap, with lock-free reads.
+
+## description:
+ConcurrentMap has the interface of Map, but stores its entries in a persistent treap (see
+dictionary.treap), so every operation is O(log n) expected whatever the insertion order;
+Map degrades to O(n) per operation, and to a RecursionError, on sorted keys.
+
+The map publishes its state as one (root, size) tuple. Writers take a lock, build the new
+treap by copying only the path to the changed key, and publish the new state with a single
+assignment. Readers take no lock at all: they read the state once and walk nodes that are
+never modified, so a lookup or an iteration sees one consistent version of the map even while
+writers replace it.
+"""
+
+import threading
+from typing import Any, Iterator, Tuple
+
+from dictionary import treap
+
+
+class ConcurrentMap:
+    """A map (dictionary) backed by a persistent treap, with lock-free reads."""
+
+    def __init__(self):
+        self._state = (None, 0)  # (root, size), replaced as a whole by writers
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._state[1]
+
+    def __getitem__(self, key: Any) -> Any:
+        node = treap.get(self._state[0], key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            root, size = self._state
+            root, added = treap.insert(root, key, value)
+            self._state = (root, size + added)
+
+    def __contains__(self, key: Any) -> bool:
+        return treap.get(self._state[0], key) is not None
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            root, size = self._state
+            self._state = (treap.delete(root, key), size - 1)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (node.key for node in treap.iterate(self._state[0]))
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        return ((node.key, node.value) for node in treap.iterate(self._state[0]))
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)})"
+
+
+if __name__ == "__main__":
+    d = ConcurrentMap()
+    d[1] = "one"
+    d[2] = "two"
+    d[3] = "three"
+    print(d)  # {1: one, 2: two, 3: three}
+    del d[2]
+    print(d)  # {1: one, 3: three}
+    print(1 in d, 2 in d)  # True False
+    print(len(d))  # 2
+
+    sorted_keys = ConcurrentMap()
+    for i in range(100_000):
+        sorted_keys[i] = i
+    print(sorted_keys[99_999])  # 99999
+
+    def read(results: list) -> None:
+        results.append(sum(1 for _ in range(1000) if 500 in sorted_keys))
+
+    results = []
+    readers = [threading.Thread(target=read, args=(results,)) for _ in range(4)]
+    for thread in readers:
+        thread.start()
+    for i in range(1000):
+        del sorted_keys[i]
+        sorted_keys[i] = i
+    for thread in readers:
+        thread.join()
+    print(len(results), len(sorted_keys))  # 4 100000
@@ -0,0 +1,137 @@
+"""
+## summary:
+The module contains a persistent (immutable) map whose versions share their unchanged entries.
+
+## classes:
+- PersistentMap: An immutable ordered map; set and delete return new versions.
+
+## description:
+A PersistentMap is never modified. set and delete return a new map that copies only the
+O(log n) expected nodes on the path to the changed key (see dictionary.treap) and shares
+every other node with the version it came from, so keeping many versions costs memory
+proportional to the changes, not to the size of the map.
+
+snapshot() is O(1): a version can be handed to readers as it is. diff() compares two versions
+and skips every subtree they share, so diffing nearby versions costs about O(d log n) for d
+differences instead of a walk over both maps.
+
+## example:
+```python
+v1 = PersistentMap().set("a", 1).set("b", 2)
+v2 = v1.set("b", 3).delete("a")
+list(v1.diff(v2))  # [('a', 1, MISSING), ('b', 2, 3)]
+```
+"""
+
+from typing import Any, Iterator, Optional, Tuple
+
+from dictionary import treap
+
+
+class _Missing:
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()  # The side of a diff on which a key is absent
+
+
+class PersistentMap:
+    """An immutable ordered map; set and delete return new versions."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self):
+        self._root: Optional[treap.TreapNode] = None
+        self._size = 0
+
+    @classmethod
+    def _version(cls, root: Optional[treap.TreapNode], size: int) -> "PersistentMap":
+        version = cls.__new__(cls)
+        version._root = root
+        version._size = size
+        return version
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, key: Any) -> Any:
+        node = treap.get(self._root, key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        node = treap.get(self._root, key)
+        return default if node is None else node.value
+
+    def __contains__(self, key: Any) -> bool:
+        return treap.get(self._root, key) is not None
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """Return a new version with the key set to the value."""
+        root, added = treap.insert(self._root, key, value)
+        return self._version(root, self._size + added)
+
+    def delete(self, key: Any) -> "PersistentMap":
+        """Return a new version without the key. Raise KeyError if the key is missing."""
+        return self._version(treap.delete(self._root, key), self._size - 1)
+
+    def snapshot(self) -> "PersistentMap":
+        """Return a version that later updates cannot change: the map itself."""
+        return self
+
+    def diff(self, other: "PersistentMap") -> Iterator[Tuple[Any, Any, Any]]:
+        """
+        Yield (key, old value, new value) in key order for every key whose value differs
+        between this version and the other. MISSING stands for the side the key is absent from.
+        """
+        return _diff(self._root, other._root)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (node.key for node in treap.iterate(self._root))
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        return ((node.key, node.value) for node in treap.iterate(self._root))
+
+    def __str__(self) -> str:
+        return "{" + ", ".join(f"{key}: {value}" for key, value in self.items()) + "}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)})"
+
+
+def _diff(old: Optional[treap.TreapNode], new: Optional[treap.TreapNode]) -> Iterator[Tuple[Any, Any, Any]]:
+    if old is new:
+        return
+    if old is None:
+        yield from ((node.key, MISSING, node.value) for node in treap.iterate(new))
+        return
+    if new is None:
+        yield from ((node.key, node.value, MISSING) for node in treap.iterate(old))
+        return
+
+    # Cut the new version at the old root's key; when the updates left that key at the top,
+    # split copies nothing and the unchanged side is skipped by the identity check above.
+    left, found, right = treap.split(new, old.key)
+    yield from _diff(old.left, left)
+    if found is None:
+        yield old.key, old.value, MISSING
+    elif found is not old and found.value != old.value:
+        yield old.key, old.value, found.value
+    yield from _diff(old.right, right)
+
+
+if __name__ == "__main__":
+    v1 = PersistentMap().set("a", 1).set("b", 2).set("c", 3)
+    v2 = v1.set("b", 20).delete("a").set("d", 4)
+
+    print(v1)  # {a: 1, b: 2, c: 3}
+    print(v2)  # {b: 20, c: 3, d: 4}
+    print(list(v1.diff(v2)))  # [('a', 1, MISSING), ('b', 2, 20), ('d', MISSING, 4)]
+    print(v1.snapshot() is v1)  # True
+
+    versions = [PersistentMap()]
+    for i in range(1000):
+        versions.append(versions[-1].set(i % 100, i))
+    print(len(versions[-1]), versions[-1][5], versions[100][5])  # 100 905 5
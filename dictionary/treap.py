@@ -0,0 +1,134 @@
+"""
+## summary:
+The module contains the primitives of a persistent (immutable) treap.
+
+## classes:
+- TreapNode: An immutable node of a treap.
+
+## functions:
+- get: Return the node holding a key, or None.
+- insert: Return a new treap with a key set to a value.
+- delete: Return a new treap without a key.
+- merge: Join two treaps whose keys are all smaller in the first one.
+- split: Split a treap into the keys smaller than, equal to and greater than a key.
+- iterate: Yield the nodes of a treap in key order.
+
+## description:
+A treap is a binary search tree on the keys and a heap on random priorities, so its shape is
+that of a tree built by inserting the keys in random order: O(log n) expected depth whatever
+the order in which the keys really arrive.
+
+Nodes are never modified. insert and delete copy only the nodes on the path to the changed key
+and share every other subtree with the treap they were given, which stays valid and unchanged.
+This lets readers keep using an old root while writers build new ones (see ConcurrentMap).
+"""
+
+import random
+from typing import Any, Iterator, Optional, Tuple
+
+
+class TreapNode:
+    """An immutable node of a treap."""
+
+    __slots__ = ("key", "value", "priority", "left", "right")
+
+    def __init__(self, key: Any, value: Any, priority: float,
+                 left: Optional["TreapNode"] = None, right: Optional["TreapNode"] = None):
+        self.key = key
+        self.value = value
+        self.priority = priority
+        self.left = left
+        self.right = right
+
+
+def get(node: Optional[TreapNode], key: Any) -> Optional[TreapNode]:
+    """Return the node holding the key, or None."""
+    while node is not None:
+        if key == node.key:
+            return node
+        node = node.left if key < node.key else node.right
+    return None
+
+
+def insert(node: Optional[TreapNode], key: Any, value: Any) -> Tuple[TreapNode, bool]:
+    """Return a new treap with the key set to the value, and whether the key is new."""
+    if node is None:
+        return TreapNode(key, value, random.random()), True
+    if key == node.key:
+        return TreapNode(key, value, node.priority, node.left, node.right), False
+
+    if key < node.key:
+        left, added = insert(node.left, key, value)
+        if left.priority > node.priority:  # Rotate right
+            right = TreapNode(node.key, node.value, node.priority, left.right, node.right)
+            return TreapNode(left.key, left.value, left.priority, left.left, right), added
+        return TreapNode(node.key, node.value, node.priority, left, node.right), added
+
+    right, added = insert(node.right, key, value)
+    if right.priority > node.priority:  # Rotate left
+        left = TreapNode(node.key, node.value, node.priority, node.left, right.left)
+        return TreapNode(right.key, right.value, right.priority, left, right.right), added
+    return TreapNode(node.key, node.value, node.priority, node.left, right), added
+
+
+def merge(left: Optional[TreapNode], right: Optional[TreapNode]) -> Optional[TreapNode]:
+    """Join two treaps, every key of left being smaller than every key of right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        return TreapNode(left.key, left.value, left.priority, left.left, merge(left.right, right))
+    return TreapNode(right.key, right.value, right.priority, merge(left, right.left), right.right)
+
+
+def split(node: Optional[TreapNode], key: Any) -> Tuple[Optional[TreapNode], Optional[TreapNode], Optional[TreapNode]]:
+    """
+    Return the treap of the keys smaller than the key, the node holding the key (or None)
+    and the treap of the keys greater than the key. If the key is at the root, the root's
+    own subtrees are returned and nothing is copied.
+    """
+    if node is None:
+        return None, None, None
+    if key == node.key:
+        return node.left, node, node.right
+    if key < node.key:
+        left, found, right = split(node.left, key)
+        return left, found, TreapNode(node.key, node.value, node.priority, right, node.right)
+    left, found, right = split(node.right, key)
+    return TreapNode(node.key, node.value, node.priority, node.left, left), found, right
+
+
+def delete(node: Optional[TreapNode], key: Any) -> Optional[TreapNode]:
+    """Return a new treap without the key. Raise KeyError if the key is missing."""
+    if node is None:
+        raise KeyError(key)
+    if key == node.key:
+        return merge(node.left, node.right)
+    if key < node.key:
+        return TreapNode(node.key, node.value, node.priority, delete(node.left, key), node.right)
+    return TreapNode(node.key, node.value, node.priority, node.left, delete(node.right, key))
+
+
+def iterate(node: Optional[TreapNode]) -> Iterator[TreapNode]:
+    """Yield the nodes of the treap in key order."""
+    stack = []
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+
+if __name__ == "__main__":
+    root = None
+    for key in range(10):
+        root, _ = insert(root, key, str(key))
+
+    old = root
+    root = delete(root, 5)
+    print([node.key for node in iterate(root)])  # [0, 1, 2, 3, 4, 6, 7, 8, 9]
+    print([node.key for node in iterate(old)])  # [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
+    print(get(old, 5).value)  # 5
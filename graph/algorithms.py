@@ -0,0 +1,231 @@
+"""
+## summary:
+The module contains graph algorithms over CSR graphs (see graph.graph).
+
+## functions:
+- bfs: Return the nodes reachable from a source in breadth-first order.
+- dfs: Return the nodes reachable from a source in depth-first preorder.
+- connected_components: Label every node of an undirected graph with its component.
+- topological_sort: Order the nodes of a directed acyclic graph (Kahn's algorithm).
+- dijkstra: Shortest path distances from a source, with non-negative weights.
+- prim: Minimum spanning forest of an undirected graph, grown with a heap.
+- kruskal: Minimum spanning forest from the edges sorted by weight, joined with union-find.
+
+## description:
+Every algorithm is iterative, so graphs with millions of nodes and long paths never hit the
+recursion limit. Dijkstra and Prim use heap.Heap with lazy deletion (stale entries are skipped
+when popped); Kruskal sorts all edges at once, with sorts.vectorized.argsort when NumPy is
+installed and sorts.merge_sort otherwise, and joins them with union_find.UnionFind.
+
+Spanning forests are lists of (u, v, weight) edges; on a connected graph they are spanning trees.
+"""
+
+from collections import deque
+from math import inf
+from typing import Iterator, List, Tuple
+
+from graph.graph import Graph
+from heap.heap import Heap
+from sorts.merge_sort import merge_sort
+from sorts.vectorized import argsort
+from union_find.union_find import UnionFind
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+def bfs(graph: Graph, source: int) -> List[int]:
+    """Return the nodes reachable from the source in breadth-first order."""
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph))
+    visited[source] = 1
+    order = [source]
+    queue = deque(order)
+    while queue:
+        u = queue.popleft()
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if not visited[v]:
+                visited[v] = 1
+                order.append(v)
+                queue.append(v)
+    return order
+
+
+def dfs(graph: Graph, source: int) -> List[int]:
+    """Return the nodes reachable from the source in depth-first preorder."""
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph))
+    visited[source] = 1
+    order = [source]
+    stack = [(source, offsets[source])]  # (node, index of its next arc)
+    while stack:
+        u, i = stack[-1]
+        if i == offsets[u + 1]:
+            stack.pop()
+            continue
+        stack[-1] = (u, i + 1)
+        v = targets[i]
+        if not visited[v]:
+            visited[v] = 1
+            order.append(v)
+            stack.append((v, offsets[v]))
+    return order
+
+
+def connected_components(graph: Graph) -> List[int]:
+    """Return the component label of every node of an undirected graph, labels counting from 0."""
+    if graph.directed:
+        raise ValueError("Connected components require an undirected graph")
+    offsets, targets = graph.offsets, graph.targets
+    labels = [-1] * len(graph)
+    label = 0
+    for source in range(len(graph)):
+        if labels[source] != -1:
+            continue
+        labels[source] = label
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                if labels[v] == -1:
+                    labels[v] = label
+                    queue.append(v)
+        label += 1
+    return labels
+
+
+def topological_sort(graph: Graph) -> List[int]:
+    """Return the nodes of a directed acyclic graph with every arc pointing forward."""
+    if not graph.directed:
+        raise ValueError("Topological sort requires a directed graph")
+    offsets, targets = graph.offsets, graph.targets
+    indegree = [0] * len(graph)
+    for v in targets:
+        indegree[v] += 1
+
+    queue = deque(u for u in range(len(graph)) if indegree[u] == 0)
+    order = []
+    while queue:
+        u = queue.popleft()
+        order.append(u)
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            indegree[v] -= 1
+            if indegree[v] == 0:
+                queue.append(v)
+    if len(order) != len(graph):
+        raise ValueError("Graph has a cycle")
+    return order
+
+
+def dijkstra(graph: Graph, source: int) -> Tuple[List[float], List[int]]:
+    """
+    Return the shortest distance from the source to every node (inf if unreachable) and the
+    predecessor of every node on its shortest path (-1 for the source and unreachable nodes).
+    """
+    if len(graph.weights) and min(graph.weights) < 0:
+        raise ValueError("Weights must be non-negative")
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    distances = [inf] * len(graph)
+    predecessors = [-1] * len(graph)
+    distances[source] = 0.0
+
+    heap = Heap()
+    heap.insert((0.0, source))
+    while len(heap):
+        distance, u = heap.pop()
+        if distance > distances[u]:
+            continue  # A shorter path to u was already settled
+        for i in range(offsets[u], offsets[u + 1]):
+            v = targets[i]
+            candidate = distance + weights[i]
+            if candidate < distances[v]:
+                distances[v] = candidate
+                predecessors[v] = u
+                heap.insert((candidate, v))
+    return distances, predecessors
+
+
+def prim(graph: Graph) -> List[Tuple[int, int, float]]:
+    """Return a minimum spanning forest of an undirected graph."""
+    if graph.directed:
+        raise ValueError("Prim requires an undirected graph")
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    in_tree = bytearray(len(graph))
+    best = [inf] * len(graph)  # The lightest known edge into each node outside the tree
+    forest = []
+    for root in range(len(graph)):
+        if in_tree[root]:
+            continue
+        heap = Heap()
+        heap.insert((0.0, -1, root))
+        while len(heap):
+            weight, u, v = heap.pop()
+            if in_tree[v]:
+                continue
+            in_tree[v] = 1
+            if u != -1:
+                forest.append((u, v, weight))
+            for i in range(offsets[v], offsets[v + 1]):
+                w, x = weights[i], targets[i]
+                if w < best[x] and not in_tree[x]:
+                    best[x] = w
+                    heap.insert((w, v, x))
+    return forest
+
+
+def _edges_by_weight(graph: Graph, chunk_size: int = 1 << 16) -> Iterator[Tuple[int, int, float]]:
+    """Yield the edges in order of weight, each undirected edge once."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    if np is not None:
+        targets_np = np.frombuffer(targets, dtype=np.int64)
+        sources_np = np.repeat(np.arange(len(graph)), np.diff(np.frombuffer(offsets, dtype=np.int64)))
+        keep = sources_np != targets_np if graph.directed else sources_np < targets_np
+        sources_np, targets_np = sources_np[keep], targets_np[keep]
+        weights_np = np.frombuffer(weights, dtype=np.float64)[keep]
+        order = argsort(weights_np)
+        # Convert a chunk at a time: kruskal usually stops long before the last edge.
+        for start in range(0, len(order), chunk_size):
+            chunk = order[start:start + chunk_size]
+            yield from zip(sources_np[chunk].tolist(), targets_np[chunk].tolist(), weights_np[chunk].tolist())
+        return
+
+    edges = [
+        (u, targets[i], weights[i])
+        for u in range(len(graph))
+        for i in range(offsets[u], offsets[u + 1])
+        if ((u != targets[i]) if graph.directed else (u < targets[i]))
+    ]
+    yield from merge_sort(edges, key=lambda edge: edge[2])
+
+
+def kruskal(graph: Graph) -> List[Tuple[int, int, float]]:
+    """Return a minimum spanning forest, treating every arc as an undirected edge."""
+    components = UnionFind(len(graph))
+    forest = []
+    for u, v, weight in _edges_by_weight(graph):
+        if components.union(u, v):
+            forest.append((u, v, weight))
+            if len(forest) == len(graph) - 1:
+                break
+    return forest
+
+
+if __name__ == "__main__":
+    #   0 --1-- 1 --2-- 3
+    #    \      |      /
+    #     4     5     1
+    #      \    |    /
+    #       `-- 2 --'
+    graph = Graph.from_edges(5, [0, 1, 0, 1, 2], [1, 3, 2, 2, 3], [1.0, 2.0, 4.0, 5.0, 1.0], directed=False)
+
+    print(bfs(graph, 0))  # [0, 1, 2, 3]
+    print(dfs(graph, 0))  # [0, 1, 3, 2]
+    print(connected_components(graph))  # [0, 0, 0, 0, 1]
+    print(dijkstra(graph, 0))  # ([0.0, 1.0, 4.0, 3.0, inf], [-1, 0, 0, 1, -1])
+    print(sum(w for _, _, w in prim(graph)))  # 4.0
+    print(sum(w for _, _, w in kruskal(graph)))  # 4.0
+
+    dag = Graph.from_edges(4, [0, 0, 1, 2], [1, 2, 3, 3])
+    print(topological_sort(dag))  # [0, 1, 2, 3]
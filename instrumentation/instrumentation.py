@@ -0,0 +1,387 @@
+"""
+## summary:
+This module contains opt-in operation counters and latency histograms for the sorts and
+data structures.
+
+## classes:
+- Histogram: Counts of non-negative integer samples in power-of-two buckets.
+- Stats: Named counters and histograms, exported with snapshot().
+
+## functions:
+- enable: Swap the instrumented functions and methods in.
+- disable: Restore the original functions and methods.
+- is_enabled: Return True if the instrumentation is enabled.
+- instrumented: A context manager that enables the instrumentation for a block and yields the stats.
+- snapshot: Return the current stats as a dict of plain values.
+- reset: Clear all counters and histograms.
+
+## description:
+Nothing is measured until enable() is called. enable() replaces the functions and methods
+below with instrumented versions, and disable() puts the originals back, so a disabled
+build runs exactly the original code with no extra branch or call.
+
+Counters (totals since the last reset):
+- sorts.<name>.comparisons: element comparisons (<, <=, >, >=) made by every sort.
+- heap.Heap._heapify_up.comparisons and heap.Heap._heapify_down.comparisons: calls of the
+  heap's comparison function.
+- dictionary.Map._get.nodes_visited and binary_search_tree.BinarySearchTree._search.nodes_visited:
+  tree nodes visited by lookups.
+- union_find.UnionFind.find.path_length: parent links followed by find, before compression.
+
+Histograms:
+- <operation>.latency_ns: the latency of every public operation, in nanoseconds.
+- union_find.UnionFind.find.path_length: the path length of every find.
+
+Sort comparisons are counted by wrapping the elements (or the keys) in counting proxies, so the
+sort itself runs unchanged. Sorts are replaced on their own module and on every loaded module that
+imported them by name; references held elsewhere (in a dict or a closure) keep the original.
+Counting slows the instrumented operations down; use it to count work, and use the latency
+histograms to compare runs that were all instrumented.
+
+## example:
+```python
+with instrumented() as stats:
+    merge_sort([3, 1, 2])
+print(stats.snapshot()["counters"])  # {'sorts.merge_sort.comparisons': 3}
+```
+"""
+
+import inspect
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from binary_search_tree.binary_search_tree import BinarySearchTree
+from dictionary.dictionary import Map
+from heap.heap import Heap
+from union_find.union_find import UnionFind
+import sorts.bubble_sort
+import sorts.counting_sort
+import sorts.insertion_sort
+import sorts.merge_sort
+import sorts.partial_sort
+import sorts.quick_sort
+import sorts.selection_sort
+
+
+class Histogram:
+    """Counts of non-negative integer samples in power-of-two buckets."""
+
+    __slots__ = ("count", "total", "max", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.max = 0
+        self.buckets: List[int] = []  # buckets[b] counts the samples with bit_length() == b
+
+    def record(self, value: int) -> None:
+        bucket = int(value).bit_length()
+        if bucket >= len(self.buckets):
+            self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> int:
+        """Return an upper bound of the q-th percentile (0 <= q <= 100)."""
+        if self.count == 0:
+            return 0
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return min((1 << bucket) - 1, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": {f"<{1 << b}": count for b, count in enumerate(self.buckets) if count},
+        }
+
+
+class Stats:
+    """Named counters and histograms, exported with snapshot()."""
+
+    def __init__(self):
+        self.counters: Dict[str, int] = defaultdict(int)
+        self.histograms: Dict[str, Histogram] = defaultdict(Histogram)
+
+    def count(self, name: str, n: int = 1) -> None:
+        self.counters[name] += n
+
+    def observe(self, name: str, value: int) -> None:
+        self.histograms[name].record(value)
+
+    def reset(self) -> None:
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "counters": dict(self.counters),
+            "histograms": {name: histogram.to_dict() for name, histogram in self.histograms.items()},
+        }
+
+
+stats = Stats()
+
+_patches: List[Tuple[Any, str, Any]] = []  # (owner, name, original), in patching order
+
+
+class _Counted:
+    """A proxy that counts the ordering comparisons made on it."""
+
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: "_Counted") -> bool:
+        _Counted.comparisons += 1
+        return self.value >= other.value
+
+    # Equality is not counted: the sorts only test it inside the tuples of decorated items.
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Counted) and self.value == other.value
+
+    __hash__ = None
+
+
+def _timed(name: str, func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats.observe(f"{name}.latency_ns", perf_counter_ns() - start)
+    return wrapper
+
+
+def _counted_arguments(func: Callable, args: tuple, kwargs: dict) -> inspect.BoundArguments:
+    """Bind a sort call with its elements (or, given a key, its keys) wrapped in _Counted."""
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    items = next(iter(bound.arguments))
+    bound.arguments[items] = [_Counted(x) for x in bound.arguments[items]]
+    key = bound.arguments.get("key")
+    if key is not None:
+        bound.arguments["key"] = lambda item: _Counted(key(item.value))
+    return bound
+
+
+def _counted_sort(name: str, func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = _counted_arguments(func, args, kwargs)
+        comparisons = _Counted.comparisons
+        start = perf_counter_ns()
+        result = func(*bound.args, **bound.kwargs)
+        stats.observe(f"{name}.latency_ns", perf_counter_ns() - start)
+        stats.count(f"{name}.comparisons", _Counted.comparisons - comparisons)
+        return [item.value for item in result]
+    return wrapper
+
+
+def _counted_iter(name: str, func: Callable) -> Callable:
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> Iterator:
+        bound = _counted_arguments(func, args, kwargs)
+        results = func(*bound.args, **bound.kwargs)
+        while True:
+            comparisons = _Counted.comparisons
+            item = next(results, _Counted)
+            stats.count(f"{name}.comparisons", _Counted.comparisons - comparisons)
+            if item is _Counted:
+                return
+            yield item.value
+    return wrapper
+
+
+def _counting_heapify(name: str, method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: Heap, index: int) -> None:
+        cmp = self._cmp
+        calls = 0
+
+        def counting_cmp(x: Any, y: Any) -> bool:
+            nonlocal calls
+            calls += 1
+            return cmp(x, y)
+
+        self._cmp = counting_cmp
+        try:
+            method(self, index)
+        finally:
+            self._cmp = cmp
+            stats.count(f"{name}.comparisons", calls)
+    return wrapper
+
+
+def _counting_visits(name: str, method: Callable) -> Callable:
+    # The lookups recurse through self, so every visited node passes through the wrapper.
+    @wraps(method)
+    def wrapper(self: Any, node: Any, key: Any) -> Any:
+        if node is not None:
+            stats.counters[f"{name}.nodes_visited"] += 1
+        return method(self, node, key)
+    return wrapper
+
+
+def _measured_find(name: str, method: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self: UnionFind, x: int) -> int:
+        parent = self.parent
+        length, node = 0, x
+        while parent[node] != node:
+            node = parent[node]
+            length += 1
+        stats.count(f"{name}.path_length", length)
+        stats.observe(f"{name}.path_length", length)
+
+        start = perf_counter_ns()
+        try:
+            return method(self, x)
+        finally:
+            stats.observe(f"{name}.latency_ns", perf_counter_ns() - start)
+    return wrapper
+
+
+_SORTS = {
+    sorts.bubble_sort: ("bubble_sort", "cocktail_sort"),
+    sorts.insertion_sort: ("insertion_sort", "binary_insertion_sort"),
+    sorts.selection_sort: ("selection_sort",),
+    sorts.merge_sort: ("merge_sort", "natural_merge_sort"),
+    sorts.quick_sort: ("quick_sort",),
+    sorts.partial_sort: ("nth_element", "partial_sort"),
+}
+
+_METHODS = [
+    (Heap, "insert", _timed),
+    (Heap, "pop", _timed),
+    (Heap, "_heapify_up", _counting_heapify),
+    (Heap, "_heapify_down", _counting_heapify),
+    (Map, "__getitem__", _timed),
+    (Map, "__setitem__", _timed),
+    (Map, "__delitem__", _timed),
+    (Map, "_get", _counting_visits),
+    (BinarySearchTree, "insert", _timed),
+    (BinarySearchTree, "search", _timed),
+    (BinarySearchTree, "remove", _timed),
+    (BinarySearchTree, "_search", _counting_visits),
+    (UnionFind, "find", _measured_find),
+    (UnionFind, "union", _timed),
+]
+
+
+def _patch(owner: Any, name: str, replacement: Any) -> None:
+    _patches.append((owner, name, getattr(owner, name)))
+    setattr(owner, name, replacement)
+
+
+def _patch_function(module: Any, name: str, replacement: Callable) -> None:
+    """Replace a module's function on that module and on every loaded module bound to it."""
+    original = getattr(module, name)
+    for loaded in list(sys.modules.values()):
+        if getattr(loaded, "__dict__", {}).get(name) is original:
+            _patch(loaded, name, replacement)
+
+
+def is_enabled() -> bool:
+    return bool(_patches)
+
+
+def enable() -> None:
+    """Swap the instrumented functions and methods in."""
+    if is_enabled():
+        return
+    for module, names in _SORTS.items():
+        for name in names:
+            _patch_function(module, name, _counted_sort(f"sorts.{name}", getattr(module, name)))
+    _patch_function(sorts.partial_sort, "sorted_iter",
+                    _counted_iter("sorts.sorted_iter", sorts.partial_sort.sorted_iter))
+    _patch_function(sorts.counting_sort, "counting_sort",
+                    _timed("sorts.counting_sort", sorts.counting_sort.counting_sort))
+    for cls, name, instrument in _METHODS:
+        qualified = f"{cls.__module__.split('.')[0]}.{cls.__name__}.{name}"
+        _patch(cls, name, instrument(qualified, cls.__dict__[name]))
+
+
+def disable() -> None:
+    """Restore the original functions and methods."""
+    while _patches:
+        owner, name, original = _patches.pop()
+        setattr(owner, name, original)
+
+
+@contextmanager
+def instrumented() -> Iterator[Stats]:
+    """Enable the instrumentation for the block and yield the stats."""
+    enable()
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Return the current stats as a dict of plain values."""
+    return stats.snapshot()
+
+
+def reset() -> None:
+    """Clear all counters and histograms."""
+    stats.reset()
+
+
+if __name__ == "__main__":
+    import json
+    from sorts.merge_sort import merge_sort
+
+    with instrumented():
+        print(merge_sort([5, 2, 4, 1, 3]))  # [1, 2, 3, 4, 5]
+
+        heap = Heap()
+        for x in [5, 2, 4, 1, 3]:
+            heap.insert(x)
+        heap.pop()
+
+        m = Map()
+        for x in [2, 1, 3]:
+            m[x] = str(x)
+        print(m[3])  # 3
+
+        uf = UnionFind(4)
+        uf.union(0, 1)
+        uf.union(1, 2)
+        print(uf.find(0))  # 2
+
+    print(merge_sort([2, 1]))  # [1, 2], not counted
+    print(json.dumps(snapshot()["counters"], indent=2))
+    print(snapshot()["histograms"]["union_find.UnionFind.find.path_length"]["max"])  # 2
@@ -8,14 +8,18 @@ This module contains classes that represent bank accounts.
 - Account: The base class for all bank accounts.
 
 ## functions:
+- lock_accounts: Lock several accounts at once, always in the same order.
 - transfer: Transfer money from one account to another.
 """
 
+import threading
+from contextlib import ExitStack, contextmanager
 from datetime import datetime
-from typing import List
+from itertools import count
+from typing import Iterator, List
 from decimal import Decimal
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 class TransactionType(Enum):
@@ -29,7 +33,10 @@ class Transaction:
     amount: Decimal
     transaction_type: TransactionType
     description: str
-    date: int = int(datetime.now().timestamp())
+    date: int = field(default_factory=lambda: int(datetime.now().timestamp()))
+
+
+_account_ids = count()
 
 
 class Account(object):
@@ -40,31 +47,62 @@ class Account(object):
         self.balance = balance
         self.create_at = int(datetime.now().timestamp())
         self.transactions: List[Transaction] = []
+        self._init_lock()
+
+    def _init_lock(self) -> None:
+        """Give the account its lock and its place in the global lock order (see lock_accounts)."""
+        self.id = next(_account_ids)
+        self.lock = threading.RLock()
+
+    def validate_amount(self, amount: Decimal) -> None:
+        """Raise ValueError if the account would reject the amount for a deposit or withdrawal."""
+        if amount <= 0:
+            raise ValueError("Amount must be positive")
     
     def deposit(self, amount: Decimal, description: str = "Deposit") -> None:
         """Deposit the given amount into the account."""
-        if amount <= 0:
-            raise ValueError("Amount must be positive")
-        self.balance += amount
-        self.transactions.append(Transaction(amount, TransactionType.DEPOSIT, description))
+        self.validate_amount(amount)
+        with self.lock:
+            self.balance += amount
+            self.transactions.append(Transaction(amount, TransactionType.DEPOSIT, description))
     
     def withdraw(self, amount: Decimal, description: str = "Withdraw") -> None:
         """Withdraw the given amount from the account."""
-        if amount <= 0:
-            raise ValueError("Amount must be positive")
-        if amount > self.balance:
-            raise ValueError("Insufficient funds")
-        self.balance -= amount
-        self.transactions.append(Transaction(amount, TransactionType.WITHDRAWAL, description))
+        self.validate_amount(amount)
+        with self.lock:
+            if amount > self.balance:
+                raise ValueError("Insufficient funds")
+            self.balance -= amount
+            self.transactions.append(Transaction(amount, TransactionType.WITHDRAWAL, description))
     
     def __str__(self) -> str:
         return f"{self.owner}'s account with balance {self.balance}"
 
 
+@contextmanager
+def lock_accounts(*accounts: Account) -> Iterator[None]:
+    """Hold the locks of all given accounts.
+
+    The locks are always taken in increasing account id order, so two threads locking
+    overlapping sets of accounts cannot deadlock.
+    """
+    with ExitStack() as stack:
+        for account in sorted({account.id: account for account in accounts}.values(), key=lambda a: a.id):
+            stack.enter_context(account.lock)
+        yield
+
+
 def transfer(amount: Decimal, source: Account, destination: Account) -> None:
-    """Transfer money from one account to another."""
-    source.withdraw(amount, f"Transfer to {destination.owner}")
-    destination.deposit(amount, f"Transfer from {source.owner}")
+    """Transfer money from one account to another.
+
+    Both accounts are locked for the whole transfer and the withdrawal is validated before
+    anything changes, so other threads never see the money missing from both accounts.
+    """
+    if source is destination:
+        raise ValueError("Cannot transfer to the same account")
+    with lock_accounts(source, destination):
+        source.withdraw(amount, f"Transfer to {destination.owner}")
+        destination.deposit(amount, f"Transfer from {source.owner}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,236 @@
+"""
+## summary:
+This module contains a columnar transaction log and a bank account that keeps its history in one.
+
+## classes:
+- TransactionLog: A columnar, append-only log of transactions with a running-balance index.
+- LedgerAccount: A bank account that stores its transactions in a TransactionLog.
+
+## functions:
+- to_minor_units: Convert a Decimal amount into an integer number of minor units (e.g. cents).
+- from_minor_units: Convert an integer number of minor units back into a Decimal amount.
+
+## description:
+Instead of one Transaction object per entry, the log keeps parallel arrays of machine integers:
+amount (in minor units), type code, timestamp, description id and the balance after the entry.
+Descriptions are interned, so a million "Deposit" entries share one string.
+Entries must be appended in time order, which makes the timestamps sorted and lets
+"balance as of time t" and time-window queries use binary search (O(log n)).
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from decimal import Decimal
+from itertools import accumulate, islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from object_oriented_programming.account import Account, Transaction, TransactionType
+
+
+AMOUNT_SCALE = 2
+
+_TYPE_CODES = {TransactionType.DEPOSIT: 0, TransactionType.WITHDRAWAL: 1}
+_TYPES = list(_TYPE_CODES)
+
+
+def to_minor_units(amount: Decimal, scale: int = AMOUNT_SCALE) -> int:
+    """Convert a Decimal amount into an integer number of minor units (e.g. cents)."""
+    scaled = Decimal(amount).scaleb(scale)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"Amount has more than {scale} decimal places")
+    return int(scaled)
+
+
+def from_minor_units(units: int, scale: int = AMOUNT_SCALE) -> Decimal:
+    """Convert an integer number of minor units back into a Decimal amount."""
+    return Decimal(units).scaleb(-scale)
+
+
+def _now() -> int:
+    return int(datetime.now().timestamp())
+
+
+class TransactionLog:
+    """A columnar, append-only log of transactions with a running-balance index."""
+
+    def __init__(self, opening_balance: Decimal = Decimal(0), scale: int = AMOUNT_SCALE):
+        self.scale = scale
+        self.opening_balance = to_minor_units(opening_balance, scale)
+
+        self.amounts = array("q")
+        self.types = array("b")
+        self.dates = array("q")
+        self.description_ids = array("i")
+        self.balances = array("q")  # Balance after each entry
+
+        self.descriptions: List[str] = []
+        self._description_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @property
+    def balance(self) -> int:
+        """Return the current balance in minor units."""
+        return self.balances[-1] if self.balances else self.opening_balance
+
+    @property
+    def last_date(self) -> Optional[int]:
+        return self.dates[-1] if self.dates else None
+
+    def intern(self, description: str) -> int:
+        """Return the id of the description, registering it if it is new."""
+        description_id = self._description_ids.get(description)
+        if description_id is None:
+            description_id = len(self.descriptions)
+            self.descriptions.append(description)
+            self._description_ids[description] = description_id
+        return description_id
+
+    def _check_date(self, date: int) -> None:
+        if self.dates and date < self.dates[-1]:
+            raise ValueError("Transactions must be appended in time order")
+
+    def append(self, amount: int, transaction_type: TransactionType, description: str, date: int) -> None:
+        """Append one entry; amount is a positive number of minor units."""
+        self._check_date(date)
+        signed = amount if transaction_type is TransactionType.DEPOSIT else -amount
+        self.amounts.append(amount)
+        self.types.append(_TYPE_CODES[transaction_type])
+        self.dates.append(date)
+        self.description_ids.append(self.intern(description))
+        self.balances.append(self.balance + signed)
+
+    def extend(self, amounts: List[int], transaction_type: TransactionType, description: str, dates: List[int]) -> None:
+        """Append entries of one type and description; amounts are positive numbers of minor units."""
+        if len(amounts) != len(dates):
+            raise ValueError("Expected one date per amount")
+        if not amounts:
+            return
+        self._check_date(dates[0])
+        if any(later < earlier for earlier, later in zip(dates, islice(dates, 1, None))):
+            raise ValueError("Transactions must be appended in time order")
+
+        signed = amounts if transaction_type is TransactionType.DEPOSIT else [-amount for amount in amounts]
+        self.balances.extend(islice(accumulate(signed, initial=self.balance), 1, None))
+        self.amounts.extend(amounts)
+        self.types.extend(repeat(_TYPE_CODES[transaction_type], len(amounts)))
+        self.dates.extend(dates)
+        self.description_ids.extend(repeat(self.intern(description), len(amounts)))
+
+    def balance_at(self, date: int) -> int:
+        """Return the balance in minor units after every entry dated at or before date."""
+        index = bisect_right(self.dates, date)
+        return self.balances[index - 1] if index else self.opening_balance
+
+    def indices_between(self, start: int, end: int) -> range:
+        """Return the indices of the entries dated in [start, end)."""
+        return range(bisect_left(self.dates, start), bisect_left(self.dates, end))
+
+    def __getitem__(self, index: int) -> Transaction:
+        return Transaction(
+            from_minor_units(self.amounts[index], self.scale),
+            _TYPES[self.types[index]],
+            self.descriptions[self.description_ids[index]],
+            self.dates[index],
+        )
+
+    def __iter__(self) -> Iterator[Transaction]:
+        return (self[i] for i in range(len(self)))
+
+
+class LedgerAccount(Account):
+    """A bank account that stores its transactions in a columnar TransactionLog."""
+
+    def __init__(self, owner: str, balance: Decimal = Decimal(0)):
+        self.owner = owner
+        self.create_at = _now()
+        self.log = TransactionLog(balance)
+        self._init_lock()
+
+    @property
+    def balance(self) -> Decimal:
+        return from_minor_units(self.log.balance, self.log.scale)
+
+    @property
+    def transactions(self) -> List[Transaction]:
+        """Return the transactions as objects (materialized on every call)."""
+        return list(self.log)
+
+    def _date(self, date: Optional[int]) -> int:
+        # The wall clock can step backwards; never let it break the time order of the log.
+        if date is None:
+            date = _now()
+            last = self.log.last_date
+            if last is not None and date < last:
+                date = last
+        return date
+
+    def _units(self, amount: Decimal) -> int:
+        units = to_minor_units(amount, self.log.scale)
+        if units <= 0:
+            raise ValueError("Amount must be positive")
+        return units
+
+    def validate_amount(self, amount: Decimal) -> None:
+        """Raise ValueError if the amount is not positive or has more decimals than the log's scale."""
+        self._units(amount)
+
+    def deposit(self, amount: Decimal, description: str = "Deposit", date: Optional[int] = None) -> None:
+        """Deposit the given amount into the account."""
+        units = self._units(amount)
+        with self.lock:
+            self.log.append(units, TransactionType.DEPOSIT, description, self._date(date))
+
+    def withdraw(self, amount: Decimal, description: str = "Withdraw", date: Optional[int] = None) -> None:
+        """Withdraw the given amount from the account."""
+        units = self._units(amount)
+        with self.lock:
+            if units > self.log.balance:
+                raise ValueError("Insufficient funds")
+            self.log.append(units, TransactionType.WITHDRAWAL, description, self._date(date))
+
+    def _batch(self, amounts: Iterable[Decimal], dates: Optional[Iterable[int]]):
+        units = [self._units(amount) for amount in amounts]
+        if dates is None:
+            dates = [self._date(None)] * len(units)
+        else:
+            dates = list(dates)
+        return units, dates
+
+    def deposit_many(self, amounts: Iterable[Decimal], description: str = "Deposit",
+                     dates: Optional[Iterable[int]] = None) -> None:
+        """Deposit every amount; nothing is recorded if any amount is invalid."""
+        with self.lock:
+            units, dates = self._batch(amounts, dates)
+            self.log.extend(units, TransactionType.DEPOSIT, description, dates)
+
+    def withdraw_many(self, amounts: Iterable[Decimal], description: str = "Withdraw",
+                      dates: Optional[Iterable[int]] = None) -> None:
+        """Withdraw every amount; nothing is recorded if any amount is invalid or funds run out."""
+        with self.lock:
+            units, dates = self._batch(amounts, dates)
+            if sum(units) > self.log.balance:
+                raise ValueError("Insufficient funds")
+            self.log.extend(units, TransactionType.WITHDRAWAL, description, dates)
+
+    def balance_at(self, date: int) -> Decimal:
+        """Return the balance after every transaction dated at or before date."""
+        return from_minor_units(self.log.balance_at(date), self.log.scale)
+
+    def transactions_between(self, start: int, end: int) -> List[Transaction]:
+        """Return the transactions dated in [start, end)."""
+        return [self.log[i] for i in self.log.indices_between(start, end)]
+
+
+if __name__ == "__main__":
+    account = LedgerAccount("Alice", Decimal(100))
+    account.deposit(Decimal("25.50"), date=1_000)
+    account.withdraw_many([Decimal(10), Decimal(20)], "Groceries", dates=[2_000, 3_000])
+    account.deposit_many([Decimal(5)] * 3, "Refund", dates=[4_000, 4_000, 5_000])
+
+    print(account)  # Alice's account with balance 110.50
+    print(account.balance_at(999))  # 100.00
+    print(account.balance_at(2_500))  # 115.50
+    print(account.transactions_between(2_000, 4_001))
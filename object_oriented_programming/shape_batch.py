@@ -0,0 +1,200 @@
+"""
+## summary:
+This module contains a columnar batch of shapes for computing many areas and perimeters at once.
+
+## classes:
+- ShapeBatch: Circles, rectangles, squares and triangles stored as columns of floats.
+
+## description:
+Instead of one Shape object per shape, a ShapeBatch keeps one float column per dimension
+(circle radii, rectangle widths and heights, square sides and triangle sides a, b, c).
+Inputs are validated for the whole column at once, with the same rules and messages as the
+Shape constructors, and areas and perimeters are computed with one vectorized formula per kind.
+
+Columns are NumPy float64 arrays when NumPy is installed and `array('d')` otherwise; the results
+use the same type. NumPy is optional, the pure-Python path computes the same values.
+
+## example:
+```python
+batch = ShapeBatch.from_specs([("circle", 3.0), ("rectangle", 2.0, 4.0), ("triangle", 3.0, 4.0, 5.0)])
+batch.areas()["triangle"]  # [6.0]
+batch.total_area()  # 42.27...
+```
+"""
+
+from array import array
+from collections import defaultdict
+from math import pi, sqrt
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+KINDS = ("circle", "rectangle", "square", "triangle")
+
+
+def _column(values: Iterable[float]):
+    if np is not None:
+        if not isinstance(values, (np.ndarray, Sequence)):
+            # np.asarray cannot read generators and other one-shot iterables.
+            return np.fromiter(values, dtype=np.float64)
+        return np.asarray(values, dtype=np.float64).ravel()
+    return array("d", values)
+
+
+def _concat(left, right):
+    if np is not None:
+        return np.concatenate((left, right))
+    return left + right
+
+
+def _all_positive(*columns) -> bool:
+    if np is not None:
+        return all(bool((column > 0).all()) for column in columns)
+    return all(x > 0 for column in columns for x in column)
+
+
+def _total(columns: Dict[str, Sequence[float]]) -> float:
+    if np is not None:
+        return float(sum(column.sum() for column in columns.values()))
+    return sum(sum(column) for column in columns.values())
+
+
+class ShapeBatch:
+    """Circles, rectangles, squares and triangles stored as columns of floats."""
+
+    def __init__(self):
+        self.radii = _column([])
+        self.widths = _column([])
+        self.heights = _column([])
+        self.sides = _column([])
+        self.a = _column([])
+        self.b = _column([])
+        self.c = _column([])
+
+    @classmethod
+    def from_specs(cls, specs: Iterable[Sequence]) -> "ShapeBatch":
+        """Build a batch from (shape_type, *args) tuples, as taken by shape_factory."""
+        columns: Dict[str, List[Tuple]] = defaultdict(list)
+        for shape_type, *args in specs:
+            if shape_type not in KINDS:
+                raise ValueError("Invalid shape type")
+            columns[shape_type].append(tuple(args))
+
+        batch = cls()
+        if columns["circle"]:
+            (radii,) = zip(*columns["circle"])
+            batch.add_circles(radii)
+        if columns["rectangle"]:
+            widths, heights = zip(*columns["rectangle"])
+            batch.add_rectangles(widths, heights)
+        if columns["square"]:
+            (sides,) = zip(*columns["square"])
+            batch.add_squares(sides)
+        if columns["triangle"]:
+            a, b, c = zip(*columns["triangle"])
+            batch.add_triangles(a, b, c)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.radii) + len(self.widths) + len(self.sides) + len(self.a)
+
+    def add_circles(self, radii: Iterable[float]) -> None:
+        radii = _column(radii)
+        if not _all_positive(radii):
+            raise ValueError("Radius must be positive")
+        self.radii = _concat(self.radii, radii)
+
+    def add_rectangles(self, widths: Iterable[float], heights: Iterable[float]) -> None:
+        widths, heights = _column(widths), _column(heights)
+        if len(widths) != len(heights):
+            raise ValueError("Expected as many widths as heights")
+        if not _all_positive(widths, heights):
+            raise ValueError("Width and height must be positive")
+        self.widths = _concat(self.widths, widths)
+        self.heights = _concat(self.heights, heights)
+
+    def add_squares(self, sides: Iterable[float]) -> None:
+        sides = _column(sides)
+        if not _all_positive(sides):
+            raise ValueError("Width and height must be positive")
+        self.sides = _concat(self.sides, sides)
+
+    def add_triangles(self, a: Iterable[float], b: Iterable[float], c: Iterable[float]) -> None:
+        a, b, c = _column(a), _column(b), _column(c)
+        if not len(a) == len(b) == len(c):
+            raise ValueError("Expected as many a, b and c sides")
+        if not _all_positive(a, b, c):
+            raise ValueError("Sides must be positive")
+        if np is not None:
+            valid = bool(((a + b > c) & (a + c > b) & (b + c > a)).all())
+        else:
+            valid = all(x + y > z and x + z > y and y + z > x for x, y, z in zip(a, b, c))
+        if not valid:
+            raise ValueError("Invalid triangle sides")
+        self.a = _concat(self.a, a)
+        self.b = _concat(self.b, b)
+        self.c = _concat(self.c, c)
+
+    def areas(self) -> Dict[str, Sequence[float]]:
+        """Return the area of every shape, by kind, in insertion order."""
+        if np is not None:
+            s = (self.a + self.b + self.c) / 2
+            return {
+                "circle": pi * self.radii ** 2,
+                "rectangle": self.widths * self.heights,
+                "square": self.sides ** 2,
+                "triangle": np.sqrt(s * (s - self.a) * (s - self.b) * (s - self.c)),
+            }
+
+        triangles = array("d")
+        for x, y, z in zip(self.a, self.b, self.c):
+            s = (x + y + z) / 2
+            triangles.append(sqrt(s * (s - x) * (s - y) * (s - z)))
+        return {
+            "circle": array("d", (pi * r * r for r in self.radii)),
+            "rectangle": array("d", (w * h for w, h in zip(self.widths, self.heights))),
+            "square": array("d", (x * x for x in self.sides)),
+            "triangle": triangles,
+        }
+
+    def perimeters(self) -> Dict[str, Sequence[float]]:
+        """Return the perimeter of every shape, by kind, in insertion order."""
+        if np is not None:
+            return {
+                "circle": 2 * pi * self.radii,
+                "rectangle": 2 * (self.widths + self.heights),
+                "square": 4 * self.sides,
+                "triangle": self.a + self.b + self.c,
+            }
+        return {
+            "circle": array("d", (2 * pi * r for r in self.radii)),
+            "rectangle": array("d", (2 * (w + h) for w, h in zip(self.widths, self.heights))),
+            "square": array("d", (4 * x for x in self.sides)),
+            "triangle": array("d", (x + y + z for x, y, z in zip(self.a, self.b, self.c))),
+        }
+
+    def total_area(self) -> float:
+        return _total(self.areas())
+
+    def total_perimeter(self) -> float:
+        return _total(self.perimeters())
+
+
+if __name__ == "__main__":
+    batch = ShapeBatch.from_specs([
+        ("circle", 3.0),
+        ("rectangle", 2.0, 4.0),
+        ("square", 2.0),
+        ("triangle", 3.0, 4.0, 5.0),
+    ])
+
+    for kind, areas in batch.areas().items():
+        print(f"{kind}: area {areas.tolist()}, perimeter {batch.perimeters()[kind].tolist()}")
+    print(batch.total_area())  # 46.27...
+
+    batch.add_circles(radius / 2 for radius in range(1, 5))
+    print(len(batch))  # 8
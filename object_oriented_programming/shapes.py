@@ -10,16 +10,103 @@ This module contains classes that represent geometric shapes.
 - Triangle: A class representing a triangle.
 
 ## functions:
+- register_shape: A class decorator that makes a shape type available to shape_factory.
 - shape_factory: A factory function that creates a shape based on the given parameters.
+- create_many: Create many shapes from (shape_type, *args) tuples.
+
+## description:
+Shapes are immutable once constructed and use __slots__, so they carry no per-instance __dict__.
+Subclasses implement area() and perimeter() and set their fields in __init__ as usual; every
+area() and perimeter() is wrapped so it is computed on the first call and cached on the instance.
+shape_factory looks the shape type up in a registry (one dict lookup), and new shape
+types join the registry with the register_shape decorator:
+
+```python
+@register_shape("hexagon")
+class Hexagon(Shape):
+    __slots__ = ("side",)
+
+    def __init__(self, side: float):
+        self.side = side
+
+    def area(self) -> float:
+        return 3 * sqrt(3) / 2 * self.side ** 2
+
+    def perimeter(self) -> float:
+        return 6 * self.side
+```
 """
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
+from functools import wraps
 from math import pi, sqrt
+from typing import Callable, Dict, Iterable, List, Sequence, Type, TypeVar
+
+
+_SHAPES: Dict[str, Type["Shape"]] = {}
+
+S = TypeVar("S", bound=type)
 
 
-class Shape(ABC):
+def register_shape(name: str) -> Callable[[S], S]:
+    """Register a shape class under the given name for shape_factory."""
+    def decorator(cls: S) -> S:
+        _SHAPES[name] = cls
+        return cls
+    return decorator
+
+
+def _cached(method: Callable[["Shape"], float], slot: str) -> Callable[["Shape"], float]:
+    @wraps(method)
+    def wrapper(self: "Shape") -> float:
+        value = getattr(self, slot, None)
+        if value is None:
+            value = method(self)
+            object.__setattr__(self, slot, value)
+        return value
+    return wrapper
+
+
+class _ShapeMeta(ABCMeta):
+    def __call__(cls, *args, **kwargs):
+        shape = super().__call__(*args, **kwargs)
+        object.__setattr__(shape, "_frozen", True)  # Fields are only assignable in __init__
+        return shape
+
+
+class Shape(ABC, metaclass=_ShapeMeta):
     """A base class for all shapes."""
 
+    __slots__ = ("_area", "_perimeter", "_frozen")
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "area" in cls.__dict__:
+            cls.area = _cached(cls.__dict__["area"], "_area")
+        if "perimeter" in cls.__dict__:
+            cls.perimeter = _cached(cls.__dict__["perimeter"], "_perimeter")
+
+    def __setattr__(self, name: str, value) -> None:
+        if getattr(self, "_frozen", False):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if hasattr(self, name)
+        }
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        # copy, deepcopy and pickle restore the slots here, bypassing __setattr__.
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
     @abstractmethod
     def area(self) -> float:
         """Return the area of the shape."""
@@ -31,9 +118,12 @@ class Shape(ABC):
         pass
 
 
+@register_shape("circle")
 class Circle(Shape):
     """A class representing a circle."""
 
+    __slots__ = ("radius",)
+
     def __init__(self, radius: float):
         if radius <= 0:
             raise ValueError("Radius must be positive")
@@ -46,63 +136,79 @@ class Circle(Shape):
         return 2 * pi * self.radius
 
 
+@register_shape("rectangle")
 class Rectangle(Shape):
     """A class representing a rectangle."""
-    
+
+    __slots__ = ("width", "height")
+
     def __init__(self, width: float, height: float):
         if width <= 0 or height <= 0:
             raise ValueError("Width and height must be positive")
         self.width = width
         self.height = height
-    
+
     def area(self) -> float:
         return self.width * self.height
-    
+
     def perimeter(self) -> float:
         return 2 * (self.width + self.height)
 
 
+@register_shape("square")
 class Square(Rectangle):
     """A class representing a square."""
-    
+
+    __slots__ = ()
+
     def __init__(self, side: float):
         super().__init__(side, side)
-    
 
+
+@register_shape("triangle")
 class Triangle(Shape):
     """A class representing a triangle."""
-    
+
+    __slots__ = ("a", "b", "c")
+
     def __init__(self, a: float, b: float, c: float):
         if a <= 0 or b <= 0 or c <= 0:
             raise ValueError("Sides must be positive")
         if a + b <= c or a + c <= b or b + c <= a:
             raise ValueError("Invalid triangle sides")
-        
+
         self.a = a
         self.b = b
         self.c = c
-    
+
     def area(self) -> float:
         s = (self.a + self.b + self.c) / 2
         return sqrt(s * (s - self.a) * (s - self.b) * (s - self.c))
-    
+
     def perimeter(self) -> float:
         return self.a + self.b + self.c
-    
+
 
 def shape_factory(shape_type: str, *args) -> Shape:
     """Create a shape based on the given parameters."""
-    
-    if shape_type == "circle":
-        return Circle(*args)
-    elif shape_type == "rectangle":
-        return Rectangle(*args)
-    elif shape_type == "square":
-        return Square(*args)
-    elif shape_type == "triangle":
-        return Triangle(*args)
-    
-    raise ValueError("Invalid shape type")
+    try:
+        shape_class = _SHAPES[shape_type]
+    except KeyError:
+        raise ValueError("Invalid shape type") from None
+    return shape_class(*args)
+
+
+def create_many(specs: Iterable[Sequence]) -> List[Shape]:
+    """Create a shape for every (shape_type, *args) tuple."""
+    registry = _SHAPES
+    shapes = []
+    for shape_type, *args in specs:
+        try:
+            shape_class = registry[shape_type]
+        except KeyError:
+            raise ValueError("Invalid shape type") from None
+        shapes.append(shape_class(*args))
+    return shapes
 
 
 if __name__ == "__main__":
@@ -112,10 +218,18 @@ if __name__ == "__main__":
         shape_factory("square", 2.0),
         shape_factory("triangle", 3.0, 4.0, 5.0)
     ]
-    
+
     for shape in shapes:
         shape_name = shape.__class__.__name__
         print(f"{shape_name}:")
         print(f"Area: {shape.area()}")
         print(f"Perimeter: {shape.perimeter()}")
         print()
+
+    print(len(create_many([("circle", 1.0), ("square", 2.0)])))  # 2
+
+    import copy
+    import pickle
+
+    square = shapes[2]
+    print(copy.deepcopy(square).area(), pickle.loads(pickle.dumps(square)).width)  # 4.0 2.0
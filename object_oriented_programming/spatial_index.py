@@ -0,0 +1,215 @@
+"""
+## summary:
+This module contains positioned shapes and a spatial index for window, nearest-neighbor and
+overlap queries over them.
+
+## classes:
+- BoundingBox: An axis-aligned rectangle given by its minimum and maximum corners.
+- PositionedShape: A shape placed at a position on the plane.
+- RTree: A static R-tree over positioned shapes, bulk-loaded with Sort-Tile-Recursive packing.
+
+## description:
+A PositionedShape wraps one of the shapes from the shapes module, which still provides the exact
+area() and perimeter(), and adds a position and a bounding box. The anchor (x, y) is:
+- Circle: the center.
+- Rectangle, Square: the lower-left corner.
+- Triangle: the first vertex; side c lies along the x axis and the triangle lies above it.
+
+The R-tree is built once from all shapes with Sort-Tile-Recursive (STR) packing: the boxes are
+sorted by x, cut into vertical slices, every slice is sorted by y and cut into full nodes, and
+the same is repeated level by level. Queries walk the tree iteratively and only descend into
+nodes whose box can contain a result, so a window query costs O(log n + k) on typical data
+instead of the O(n) scan (and O(n^2) for all overlapping pairs) of a brute-force loop.
+Overlaps and distances are computed on bounding boxes; they are candidates for an exact check.
+"""
+
+import heapq
+from itertools import count
+from math import ceil, sqrt
+from typing import Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from object_oriented_programming.shapes import Circle, Rectangle, Shape, Triangle
+
+
+class BoundingBox(NamedTuple):
+    """An axis-aligned rectangle given by its minimum and maximum corners."""
+    min_x: float
+    min_y: float
+    max_x: float
+    max_y: float
+
+    def intersects(self, other: "BoundingBox") -> bool:
+        return (self.min_x <= other.max_x and other.min_x <= self.max_x
+                and self.min_y <= other.max_y and other.min_y <= self.max_y)
+
+    def distance_squared(self, x: float, y: float) -> float:
+        """Return the squared distance from the point to the nearest point of the box."""
+        dx = max(self.min_x - x, 0.0, x - self.max_x)
+        dy = max(self.min_y - y, 0.0, y - self.max_y)
+        return dx * dx + dy * dy
+
+    @staticmethod
+    def union(boxes: Sequence["BoundingBox"]) -> "BoundingBox":
+        return BoundingBox(
+            min(box.min_x for box in boxes),
+            min(box.min_y for box in boxes),
+            max(box.max_x for box in boxes),
+            max(box.max_y for box in boxes),
+        )
+
+
+def _bounds(shape: Shape, x: float, y: float) -> BoundingBox:
+    if isinstance(shape, Circle):
+        r = shape.radius
+        return BoundingBox(x - r, y - r, x + r, y + r)
+    if isinstance(shape, Rectangle):
+        return BoundingBox(x, y, x + shape.width, y + shape.height)
+    if isinstance(shape, Triangle):
+        # Vertices (0, 0), (c, 0) and the apex, whose x follows from the law of cosines.
+        apex_x = (shape.b ** 2 + shape.c ** 2 - shape.a ** 2) / (2 * shape.c)
+        apex_y = sqrt(max(shape.b ** 2 - apex_x ** 2, 0.0))
+        return BoundingBox(x + min(0.0, apex_x), y, x + max(shape.c, apex_x), y + apex_y)
+    raise TypeError(f"Cannot position a {type(shape).__name__}")
+
+
+class PositionedShape:
+    """A shape placed at a position on the plane.
+
+    Positioned shapes are immutable like the shapes they wrap, so the bounding box computed at
+    construction (and the R-trees built from it) can never go stale.
+    """
+
+    __slots__ = ("shape", "x", "y", "bbox")
+
+    def __init__(self, shape: Shape, x: float, y: float):
+        object.__setattr__(self, "shape", shape)
+        object.__setattr__(self, "x", x)
+        object.__setattr__(self, "y", y)
+        object.__setattr__(self, "bbox", _bounds(shape, x, y))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        return type(self), (self.shape, self.x, self.y)
+
+    def area(self) -> float:
+        return self.shape.area()
+
+    def perimeter(self) -> float:
+        return self.shape.perimeter()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({type(self.shape).__name__}, x={self.x}, y={self.y})"
+
+
+class _Node:
+    __slots__ = ("bbox", "children", "leaf")
+
+    def __init__(self, bbox: BoundingBox, children: list, leaf: bool):
+        self.bbox = bbox
+        self.children = children  # Item indices in a leaf, _Nodes otherwise
+        self.leaf = leaf
+
+
+class RTree:
+    """A static R-tree over positioned shapes, bulk-loaded with Sort-Tile-Recursive packing."""
+
+    def __init__(self, items: Sequence[PositionedShape], node_capacity: int = 16):
+        if node_capacity < 2:
+            raise ValueError("Node capacity must be at least 2")
+        self.items = list(items)
+        self.node_capacity = node_capacity
+        self.root: Optional[_Node] = None
+
+        entries = [(item.bbox, i) for i, item in enumerate(self.items)]
+        leaf = True
+        while entries:
+            nodes = [
+                _Node(BoundingBox.union([box for box, _ in group]), [child for _, child in group], leaf)
+                for group in self._pack(entries)
+            ]
+            if len(nodes) == 1:
+                self.root = nodes[0]
+                break
+            entries = [(node.bbox, node) for node in nodes]
+            leaf = False
+
+    def _pack(self, entries: list) -> List[list]:
+        """Group entries into nodes of node_capacity using STR tiling."""
+        capacity = self.node_capacity
+        node_count = ceil(len(entries) / capacity)
+        slice_size = ceil(sqrt(node_count)) * capacity
+
+        entries = sorted(entries, key=lambda entry: entry[0].min_x + entry[0].max_x)
+        groups = []
+        for start in range(0, len(entries), slice_size):
+            tile = sorted(entries[start:start + slice_size], key=lambda entry: entry[0].min_y + entry[0].max_y)
+            groups.extend(tile[i:i + capacity] for i in range(0, len(tile), capacity))
+        return groups
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _search(self, window: BoundingBox) -> Iterator[int]:
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                for i in node.children:
+                    if self.items[i].bbox.intersects(window):
+                        yield i
+            else:
+                stack.extend(child for child in node.children if child.bbox.intersects(window))
+
+    def query(self, window: BoundingBox) -> List[PositionedShape]:
+        """Return every shape whose bounding box intersects the window."""
+        return [self.items[i] for i in self._search(window)]
+
+    def nearest(self, x: float, y: float, k: int = 1) -> List[PositionedShape]:
+        """Return the k shapes whose bounding boxes are closest to the point, closest first."""
+        if self.root is None or k <= 0:
+            return []
+        tie = count()
+        queue = [(self.root.bbox.distance_squared(x, y), next(tie), self.root)]
+        result = []
+        while queue and len(result) < k:
+            _, _, entry = heapq.heappop(queue)
+            if isinstance(entry, int):
+                result.append(self.items[entry])
+            elif entry.leaf:
+                for i in entry.children:
+                    heapq.heappush(queue, (self.items[i].bbox.distance_squared(x, y), next(tie), i))
+            else:
+                for child in entry.children:
+                    heapq.heappush(queue, (child.bbox.distance_squared(x, y), next(tie), child))
+        return result
+
+    def overlapping_pairs(self) -> Iterator[Tuple[PositionedShape, PositionedShape]]:
+        """Yield every pair of shapes whose bounding boxes intersect, each pair once."""
+        for i, item in enumerate(self.items):
+            for j in self._search(item.bbox):
+                if j > i:
+                    yield item, self.items[j]
+
+
+if __name__ == "__main__":
+    from object_oriented_programming.shapes import Square
+
+    shapes = [
+        PositionedShape(Circle(1.0), 0.0, 0.0),
+        PositionedShape(Square(2.0), 0.5, 0.5),
+        PositionedShape(Rectangle(1.0, 3.0), 10.0, 10.0),
+        PositionedShape(Triangle(3.0, 4.0, 5.0), 20.0, 0.0),
+    ]
+    tree = RTree(shapes, node_capacity=2)
+
+    print(tree.query(BoundingBox(9.0, 9.0, 12.0, 12.0)))  # [Rectangle at (10, 10)]
+    print(tree.nearest(19.0, 1.0))  # [Triangle at (20, 0)]
+    print(list(tree.overlapping_pairs()))  # [(Circle, Square)]
+    print(sum(shape.area() for shape in tree.query(BoundingBox(-5, -5, 5, 5))))  # pi + 4
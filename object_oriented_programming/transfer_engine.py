@@ -0,0 +1,198 @@
+"""
+## summary:
+This module contains engines that apply transfers between bank accounts atomically and concurrently.
+
+## classes:
+- Transfer: A transfer of an amount from one account to another.
+- TransferEngine: Applies single transfers and netted batches of transfers under per-account locks.
+- AsyncTransferEngine: An asyncio front end that queues transfers and settles them in batches.
+
+## description:
+Every account has its own lock and locks are always taken in increasing account id order
+(see account.lock_accounts), so transfers touching different accounts run in parallel and
+transfers touching the same accounts cannot deadlock.
+
+A batch is settled by netting: the transfers are summed into one balance change per account,
+all involved accounts are locked once, every resulting balance is checked, and only then is a
+single deposit or withdrawal applied per account. A hot account that appears in a thousand
+transfers of a batch is locked and written once. A batch is all-or-nothing: every amount is
+validated with the account's own rules before anything changes, and if an account still
+rejects its change, the changes already applied are reversed before the error is raised.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from object_oriented_programming.account import Account, lock_accounts, transfer
+
+
+@dataclass(frozen=True)
+class Transfer:
+    """A transfer of an amount from one account to another."""
+    amount: Decimal
+    source: Account
+    destination: Account
+
+
+class TransferEngine:
+    """Applies single transfers and netted batches of transfers under per-account locks."""
+
+    def __init__(self, description: str = "Settlement"):
+        self.description = description
+
+    def transfer(self, amount: Decimal, source: Account, destination: Account) -> None:
+        """Apply one transfer atomically."""
+        transfer(amount, source, destination)
+
+    def settle(self, transfers: Iterable[Transfer]) -> None:
+        """Apply a batch of transfers atomically, as one net balance change per account."""
+        net: Dict[int, Tuple[Account, Decimal]] = {}
+        for item in transfers:
+            if item.amount <= 0:
+                raise ValueError("Amount must be positive")
+            if item.source is item.destination:
+                raise ValueError("Cannot transfer to the same account")
+            source, delta = net.get(item.source.id, (item.source, Decimal(0)))
+            net[item.source.id] = (source, delta - item.amount)
+            destination, delta = net.get(item.destination.id, (item.destination, Decimal(0)))
+            net[item.destination.id] = (destination, delta + item.amount)
+
+        # Withdrawals first, so deposits never hide a missing balance.
+        changes = sorted(((account, delta) for account, delta in net.values() if delta != 0),
+                         key=lambda change: change[1] > 0)
+        with lock_accounts(*(account for account, _ in changes)):
+            for account, delta in changes:
+                account.validate_amount(abs(delta))
+                if account.balance + delta < 0:
+                    raise ValueError(f"Insufficient funds in {account.owner}'s account")
+
+            applied: List[Tuple[Account, Decimal]] = []
+            try:
+                for account, delta in changes:
+                    if delta < 0:
+                        account.withdraw(-delta, self.description)
+                    else:
+                        account.deposit(delta, self.description)
+                    applied.append((account, delta))
+            except Exception:
+                for account, delta in reversed(applied):
+                    if delta < 0:
+                        account.deposit(-delta, f"Reversal of {self.description}")
+                    else:
+                        account.withdraw(delta, f"Reversal of {self.description}")
+                raise
+
+
+class AsyncTransferEngine:
+    """An asyncio front end that queues transfers and settles them in batches.
+
+    Transfers wait in a bounded queue, so producers are slowed down instead of piling up
+    unbounded work. A worker task drains up to batch_size queued transfers at a time and
+    settles them in a thread. If the netted batch fails, its transfers are applied one by one
+    so only the failing ones report an error.
+
+    ```python
+    async with AsyncTransferEngine() as engine:
+        await engine.submit(Decimal(10), alice, bob)
+    ```
+    """
+
+    def __init__(self, engine: Optional[TransferEngine] = None, max_pending: int = 1024, batch_size: int = 256):
+        self.engine = engine or TransferEngine()
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue = asyncio.Queue(max_pending)
+        self._worker: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "AsyncTransferEngine":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+    def start(self) -> None:
+        """Start the worker task."""
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Settle everything already queued and stop the worker task."""
+        if self._worker is not None:
+            await self._queue.put(None)
+            await self._worker
+            self._worker = None
+
+    async def submit(self, amount: Decimal, source: Account, destination: Account) -> None:
+        """Queue a transfer and wait until it has been applied (or raise why it was not)."""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((Transfer(amount, source, destination), future))
+        await future
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch = []
+            item = await self._queue.get()
+            while item is not None:
+                batch.append(item)
+                if len(batch) == self.batch_size or self._queue.empty():
+                    break
+                item = self._queue.get_nowait()
+            stopping = item is None
+
+            if batch:
+                try:
+                    errors = await asyncio.to_thread(self._settle, [item for item, _ in batch])
+                except Exception as error:  # Fail this batch, keep serving the queue
+                    errors = [error] * len(batch)
+                for (_, future), error in zip(batch, errors):
+                    if future.cancelled():
+                        continue
+                    if error is None:
+                        future.set_result(None)
+                    else:
+                        future.set_exception(error)
+
+    def _settle(self, transfers: List[Transfer]) -> List[Optional[Exception]]:
+        try:
+            self.engine.settle(transfers)
+            return [None] * len(transfers)
+        except Exception:
+            pass
+
+        errors: List[Optional[Exception]] = []
+        for item in transfers:
+            try:
+                self.engine.transfer(item.amount, item.source, item.destination)
+                errors.append(None)
+            except Exception as error:
+                errors.append(error)
+        return errors
+
+
+if __name__ == "__main__":
+    alice = Account("Alice", Decimal(100))
+    bob = Account("Bob", Decimal(50))
+    carol = Account("Carol", Decimal(0))
+
+    engine = TransferEngine()
+    engine.settle([
+        Transfer(Decimal(30), alice, bob),
+        Transfer(Decimal(60), bob, carol),
+        Transfer(Decimal(10), carol, alice),
+    ])
+    print(alice, bob, carol, sep="\n")  # 80, 20, 50
+
+    async def main() -> None:
+        async with AsyncTransferEngine() as front_end:
+            results = await asyncio.gather(
+                front_end.submit(Decimal(5), alice, bob),
+                front_end.submit(Decimal(500), bob, carol),
+                return_exceptions=True,
+            )
+        print(results)  # [None, ValueError('Insufficient funds')]
+
+    asyncio.run(main())
+    print(alice, bob, carol, sep="\n")  # 75, 25, 50
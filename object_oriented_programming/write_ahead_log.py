@@ -0,0 +1,323 @@
+"""
+## summary:
+This module contains a write-ahead log that makes bank account state survive restarts.
+
+## classes:
+- WriteAheadLog: An append-only file of binary account operation records.
+- DurableLedger: A set of accounts whose every change is logged before it is applied.
+
+## description:
+Every deposit, withdrawal and transfer is validated, appended to the log and only then applied
+to the in-memory LedgerAccount. A record is a fixed 35-byte header followed by an optional UTF-8
+payload (the owner name for account openings, the description otherwise):
+
+    crc32 (I) | header crc32 (I) | op (B) | account (I) | counterparty (I) | amount in minor units (q) | date (q) | payload length (H)
+
+The first CRC covers everything after it, the header CRC covers the fields after it, so a
+damaged payload length is caught before it is used to find the end of the record. Only the
+last record can be torn: one cut short by a crash (a partial header, or a valid header whose
+payload runs past the end of the file), one that fails its CRC and ends exactly at the end of
+the file, or one followed only by zero bytes is dropped. Any other record that fails a CRC
+means the file is corrupt, and recovery raises a ValueError instead of discarding the
+acknowledged operations after it.
+
+Durability is controlled by group commit: the log is fsynced once every `group_commit` records
+(and on sync/snapshot/close) instead of after every record. With group_commit=1 every
+acknowledged operation survives a crash; larger values trade the last few operations for
+throughput.
+
+A snapshot stores every balance together with the log offset it reflects. Recovery loads the
+latest snapshot and replays only the log records after that offset, reading the log through
+mmap. History from before the snapshot is not reloaded, only the balances. Snapshots are taken
+by calling snapshot(), or automatically every `snapshot_every` records.
+"""
+
+import mmap
+import os
+import struct
+import threading
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+from object_oriented_programming.account import TransactionType
+from object_oriented_programming.ledger import LedgerAccount, from_minor_units, to_minor_units
+
+
+OPEN, DEPOSIT, WITHDRAWAL, TRANSFER = range(4)
+
+_HEADER = struct.Struct("<IIBIIqqH")
+_FIELDS = struct.Struct("<BIIqqH")
+_SNAPSHOT_HEADER = struct.Struct("<4sqI")
+_SNAPSHOT_ENTRY = struct.Struct("<IqH")
+_SNAPSHOT_MAGIC = b"LSNP"
+
+LOG_FILE = "ledger.wal"
+SNAPSHOT_FILE = "ledger.snapshot"
+
+
+def _positive_units(amount: Decimal) -> int:
+    units = to_minor_units(amount)
+    if units <= 0:
+        raise ValueError("Amount must be positive")
+    return units
+
+
+def _pack_record(op: int, account: int, counterparty: int = 0, amount: int = 0,
+                 date: int = 0, payload: bytes = b"") -> bytes:
+    fields = _FIELDS.pack(op, account, counterparty, amount, date, len(payload))
+    body = struct.pack("<I", zlib.crc32(fields)) + fields + payload
+    return struct.pack("<I", zlib.crc32(body)) + body
+
+
+class WriteAheadLog:
+    """An append-only file of binary account operation records."""
+
+    def __init__(self, path: str, group_commit: int = 1):
+        self.path = path
+        self.group_commit = group_commit
+        self._file = open(path, "ab")
+        self._pending = 0
+
+    @property
+    def offset(self) -> int:
+        """Return the log size in bytes, including buffered records."""
+        return self._file.tell()
+
+    def append(self, op: int, account: int, counterparty: int = 0, amount: int = 0,
+               date: int = 0, payload: bytes = b"") -> None:
+        """Append one record, syncing if the group commit is full."""
+        self._file.write(_pack_record(op, account, counterparty, amount, date, payload))
+        self._pending += 1
+        if self._pending >= self.group_commit:
+            self.sync()
+
+    def sync(self) -> None:
+        """Flush buffered records and fsync them to disk."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+
+    def close(self) -> None:
+        self.sync()
+        self._file.close()
+
+    @staticmethod
+    def replay(path: str, start: int = 0):
+        """Yield (offset after record, op, account, counterparty, amount, date, payload) from start.
+
+        Stops at the end of the file or at a torn final record, and raises ValueError on any
+        other corrupt record.
+        """
+        if not os.path.exists(path) or os.path.getsize(path) <= start:
+            return
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            offset = start
+            size = len(data)
+            unpack_from = _HEADER.unpack_from
+            while offset + _HEADER.size <= size:
+                crc, header_crc, op, account, counterparty, amount, date, length = unpack_from(data, offset)
+                if zlib.crc32(data[offset + 8:offset + _HEADER.size]) != header_crc:
+                    if not data[offset:].strip(b"\x00"):
+                        return  # Torn tail
+                    raise ValueError(f"Corrupt record header at offset {offset} of {path}")
+                end = offset + _HEADER.size + length
+                if end > size:
+                    return  # Torn tail: the payload was cut short
+                if zlib.crc32(data[offset + 4:end]) != crc:
+                    if end == size:
+                        return  # Torn tail
+                    raise ValueError(f"Corrupt record at offset {offset} of {path}")
+                yield end, op, account, counterparty, amount, date, data[offset + _HEADER.size:end]
+                offset = end
+
+
+class DurableLedger:
+    """A set of accounts whose every change is logged before it is applied.
+
+    ```python
+    ledger = DurableLedger("/var/lib/ledger", group_commit=64, snapshot_every=100_000)
+    ledger.open_account("Alice", Decimal(100))
+    ledger.deposit("Alice", Decimal(25))
+    ledger.snapshot()
+    ledger.close()
+
+    ledger = DurableLedger("/var/lib/ledger")  # Recovers the state
+    ```
+    """
+
+    def __init__(self, directory: str, group_commit: int = 1, snapshot_every: Optional[int] = None):
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self._since_snapshot = 0
+        self.accounts: Dict[str, LedgerAccount] = {}
+        self._names: List[str] = []  # Durable account id -> owner
+        self._ids: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._log_path = os.path.join(directory, LOG_FILE)
+        self._snapshot_path = os.path.join(directory, SNAPSHOT_FILE)
+        self._recover()
+        self._log = WriteAheadLog(self._log_path, group_commit)
+
+    def _register(self, owner: str, balance: Decimal = Decimal(0)) -> LedgerAccount:
+        account = LedgerAccount(owner, balance)
+        self._ids[owner] = len(self._names)
+        self._names.append(owner)
+        self.accounts[owner] = account
+        return account
+
+    def _recover(self) -> None:
+        start = 0
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, "rb") as file:
+                data = file.read()
+            magic, start, count = _SNAPSHOT_HEADER.unpack_from(data, 0)
+            if magic != _SNAPSHOT_MAGIC:
+                raise ValueError(f"{self._snapshot_path} is not a ledger snapshot")
+            offset = _SNAPSHOT_HEADER.size
+            for _ in range(count):
+                _, balance, length = _SNAPSHOT_ENTRY.unpack_from(data, offset)
+                offset += _SNAPSHOT_ENTRY.size
+                owner = data[offset:offset + length].decode()
+                offset += length
+                self._register(owner, from_minor_units(balance))
+
+        good = start
+        for good, op, account, counterparty, amount, date, payload in WriteAheadLog.replay(self._log_path, start):
+            if op == OPEN:
+                self._register(payload.decode(), from_minor_units(amount))
+                continue
+            description = payload.decode()
+            if op == DEPOSIT:
+                self.accounts[self._names[account]].log.append(amount, TransactionType.DEPOSIT, description, date)
+            elif op == WITHDRAWAL:
+                self.accounts[self._names[account]].log.append(amount, TransactionType.WITHDRAWAL, description, date)
+            elif op == TRANSFER:
+                source, destination = self._names[account], self._names[counterparty]
+                self.accounts[source].log.append(amount, TransactionType.WITHDRAWAL, f"Transfer to {destination}", date)
+                self.accounts[destination].log.append(amount, TransactionType.DEPOSIT, f"Transfer from {source}", date)
+
+        # Drop a torn tail so new records are appended right after the last good one.
+        if os.path.exists(self._log_path) and os.path.getsize(self._log_path) > good:
+            os.truncate(self._log_path, good)
+
+    def _append(self, *record, **fields) -> None:
+        self._log.append(*record, **fields)
+        self._since_snapshot += 1
+
+    def _maybe_snapshot(self) -> None:
+        if self.snapshot_every and self._since_snapshot >= self.snapshot_every:
+            self._snapshot()
+
+    def _account(self, owner: str) -> LedgerAccount:
+        if owner not in self.accounts:
+            raise KeyError(owner)
+        return self.accounts[owner]
+
+    def _date(self, *accounts: LedgerAccount) -> int:
+        return max([int(datetime.now().timestamp())] + [account.log.last_date for account in accounts if account.log.last_date is not None])
+
+    def open_account(self, owner: str, balance: Decimal = Decimal(0)) -> LedgerAccount:
+        """Open and return a new account."""
+        with self._lock:
+            if owner in self.accounts:
+                raise ValueError(f"Account {owner} already exists")
+            units = to_minor_units(balance)
+            self._append(OPEN, len(self._names), amount=units, payload=owner.encode())
+            account = self._register(owner, balance)
+            self._maybe_snapshot()
+            return account
+
+    def deposit(self, owner: str, amount: Decimal, description: str = "Deposit") -> None:
+        """Deposit the given amount into the owner's account."""
+        with self._lock:
+            account = self._account(owner)
+            units = _positive_units(amount)
+            date = self._date(account)
+            self._append(DEPOSIT, self._ids[owner], amount=units, date=date, payload=description.encode())
+            account.log.append(units, TransactionType.DEPOSIT, description, date)
+            self._maybe_snapshot()
+
+    def withdraw(self, owner: str, amount: Decimal, description: str = "Withdraw") -> None:
+        """Withdraw the given amount from the owner's account."""
+        with self._lock:
+            account = self._account(owner)
+            units = _positive_units(amount)
+            if units > account.log.balance:
+                raise ValueError("Insufficient funds")
+            date = self._date(account)
+            self._append(WITHDRAWAL, self._ids[owner], amount=units, date=date, payload=description.encode())
+            account.log.append(units, TransactionType.WITHDRAWAL, description, date)
+            self._maybe_snapshot()
+
+    def transfer(self, amount: Decimal, source: str, destination: str) -> None:
+        """Transfer money from one account to another."""
+        with self._lock:
+            if source == destination:
+                raise ValueError("Cannot transfer to the same account")
+            source_account, destination_account = self._account(source), self._account(destination)
+            units = _positive_units(amount)
+            if units > source_account.log.balance:
+                raise ValueError("Insufficient funds")
+            date = self._date(source_account, destination_account)
+            self._append(TRANSFER, self._ids[source], self._ids[destination], units, date)
+            source_account.log.append(units, TransactionType.WITHDRAWAL, f"Transfer to {destination}", date)
+            destination_account.log.append(units, TransactionType.DEPOSIT, f"Transfer from {source}", date)
+            self._maybe_snapshot()
+
+    def sync(self) -> None:
+        """Make every logged operation durable."""
+        with self._lock:
+            self._log.sync()
+
+    def snapshot(self) -> None:
+        """Write the current balances so recovery only replays the log after this point."""
+        with self._lock:
+            self._snapshot()
+
+    def _snapshot(self) -> None:
+        self._log.sync()
+        parts = [_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, self._log.offset, len(self._names))]
+        for account_id, owner in enumerate(self._names):
+            name = owner.encode()
+            parts.append(_SNAPSHOT_ENTRY.pack(account_id, self.accounts[owner].log.balance, len(name)))
+            parts.append(name)
+
+        temporary = self._snapshot_path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(b"".join(parts))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._snapshot_path)
+        self._since_snapshot = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._log.close()
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as directory:
+        ledger = DurableLedger(directory, group_commit=8)
+        ledger.open_account("Alice", Decimal(100))
+        ledger.open_account("Bob")
+        ledger.transfer(Decimal(30), "Alice", "Bob")
+        ledger.snapshot()
+        ledger.deposit("Bob", Decimal("4.50"), "Refund")
+        ledger.withdraw("Alice", Decimal(10))
+        ledger.close()
+
+        # Simulate a crash in the middle of writing a record.
+        with open(os.path.join(directory, LOG_FILE), "ab") as log:
+            log.write(b"\x00" * 10)
+
+        recovered = DurableLedger(directory)
+        print(recovered.accounts["Alice"])  # Alice's account with balance 60.00
+        print(recovered.accounts["Bob"])  # Bob's account with balance 34.50
+        print(recovered.accounts["Bob"].transactions)  # Only the refund after the snapshot
+        recovered.close()
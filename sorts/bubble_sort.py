@@ -5,23 +5,56 @@
 Bubble sort is a simple sorting algorithm that repeatedly steps through the list,
 compares adjacent elements and swaps them if they are in the wrong order. The time
 complexity of bubble sort is O(n^2) in the worst case.
+
+Every pass remembers where its last swap happened; everything after it is already in place,
+so the next pass stops there and a pass without swaps ends the sort. On sorted input this is O(n).
+Cocktail sort alternates forward and backward passes, so a small element near the end
+(a "turtle") moves to the front in one backward pass instead of one position per pass.
 """
 
-from typing import List, Callable
+from typing import List, Callable, Optional
+
+from sorts.keys import decorate, undecorate
 
 
-def bubble_sort(arr: List[any], key: Callable[[any, any], bool] = lambda x, y: x < y) -> List[any]:
+def bubble_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
     """Sort the array using bubble sort."""
-    new_arr = arr.copy()
-    
-    n = len(new_arr)
-    for i in range(n):
-        for j in range(n - i - 1):
-            if not key(new_arr[j], new_arr[j + 1]):
+    new_arr = decorate(arr, key, reverse)
+
+    end = len(new_arr) - 1
+    while end > 0:
+        last_swap = 0
+        for j in range(end):
+            if new_arr[j + 1] < new_arr[j]:
+                new_arr[j], new_arr[j + 1] = new_arr[j + 1], new_arr[j]
+                last_swap = j
+        end = last_swap
+    return undecorate(new_arr, key, reverse)
+
+
+def cocktail_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
+    """Sort the array using cocktail shaker sort (bidirectional bubble sort)."""
+    new_arr = decorate(arr, key, reverse)
+
+    start, end = 0, len(new_arr) - 1
+    while start < end:
+        last_swap = start
+        for j in range(start, end):
+            if new_arr[j + 1] < new_arr[j]:
                 new_arr[j], new_arr[j + 1] = new_arr[j + 1], new_arr[j]
-    return new_arr
+                last_swap = j
+        end = last_swap
+
+        last_swap = end
+        for j in range(end, start, -1):
+            if new_arr[j] < new_arr[j - 1]:
+                new_arr[j], new_arr[j - 1] = new_arr[j - 1], new_arr[j]
+                last_swap = j
+        start = last_swap
+    return undecorate(new_arr, key, reverse)
 
 
 if __name__ == "__main__":
     nums = [64, 34, 25, 12, 22, 11, 90]
     print(bubble_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
+    print(cocktail_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
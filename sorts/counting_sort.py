@@ -6,33 +6,53 @@ Counting sort is a sorting algorithm that sorts the elements of an array by coun
 number of occurrences of each unique element in the array and then sorting them based on
 their frequencies. The time complexity of counting sort is O(n + k), where n is the number
 of elements in the array and k is the range of the input.
+
+With a key function the keys must be integers; every element is placed at the next free
+position of its key's bucket, so elements with equal keys keep their input order.
 """
 
-from typing import List
+from typing import List, Callable, Optional
 
 
-def counting_sort(arr: List[int]) -> List[int]:
+def counting_sort(arr: List[any], key: Optional[Callable[[any], int]] = None, reverse: bool = False) -> List[any]:
     """Sort the array using counting sort."""
     n = len(arr)
     if n <= 1:
-        return arr
-    
-    max_val = max(arr)
-    min_val = min(arr)
-    
+        return arr.copy()
+
+    keys = arr if key is None else [key(x) for x in arr]
+    max_val = max(keys)
+    min_val = min(keys)
+
     counts = [0] * (max_val - min_val + 1)
-    for num in arr:
-        counts[num - min_val] += 1
-    
-    sorted_arr = []
-    for i, freq in enumerate(counts):
-        if freq == 0:
-            continue
-        sorted_arr += [i + min_val] * freq
+    for k in keys:
+        counts[k - min_val] += 1
+
+    if key is None:
+        sorted_arr = []
+        for i, freq in enumerate(counts):
+            if freq == 0:
+                continue
+            sorted_arr += [i + min_val] * freq
+        if reverse:
+            sorted_arr.reverse()
+        return sorted_arr
+
+    buckets = range(len(counts) - 1, -1, -1) if reverse else range(len(counts))
+    starts = [0] * len(counts)
+    total = 0
+    for i in buckets:
+        starts[i] = total
+        total += counts[i]
 
-    return sorted_arr        
+    sorted_arr = [None] * n
+    for k, x in zip(keys, arr):
+        sorted_arr[starts[k - min_val]] = x
+        starts[k - min_val] += 1
+    return sorted_arr
 
 
 if __name__ == "__main__":
     nums = [64, 34, 25, 12, 22, 11, 90]
     print(counting_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
+    print(counting_sort(["ccc", "a", "bb", "d"], key=len))  # ['a', 'd', 'bb', 'ccc']
@@ -0,0 +1,146 @@
+"""
+## External Sort
+
+### Description
+External sort orders a file of fixed-width binary records that is too large to sort in memory.
+It works in two phases:
+- Run generation: the input is read in chunks of at most `memory_limit` bytes, every chunk is
+  sorted in memory with merge sort and written to a temporary run file.
+- Merge: runs are merged with a streaming k-way heap merge, reading every run through a
+  read-ahead buffer and writing the output in large batches. At most `max_fan_in` runs are
+  open at once: while there are more, groups of `max_fan_in` runs are merged into longer
+  intermediate runs, so huge inputs neither run out of file descriptors nor shrink every
+  read-ahead buffer to a few records.
+
+Records are described by a `struct` format string (e.g. "<q" for little-endian int64 keys,
+"<qq" for a key and a payload) and are ordered by their unpacked fields, first field first.
+The time complexity is O(n log n) and the I/O is 1 + ceil(log(runs) / log(max_fan_in))
+sequential passes over the data: two as long as there are at most `max_fan_in` runs.
+"""
+
+import os
+import struct
+import tempfile
+from heapq import merge
+from typing import Iterator, List, Tuple
+
+from sorts.merge_sort import merge_sort
+
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+READ_AHEAD = 1024 * 1024
+WRITE_BATCH = 64 * 1024
+MAX_FAN_IN = 64
+
+
+def _read_records(path: str, record: struct.Struct, buffer_size: int) -> Iterator[Tuple]:
+    with open(path, "rb", buffering=0) as file:
+        while True:
+            block = file.read(buffer_size)
+            if not block:
+                return
+            yield from record.iter_unpack(block)
+
+
+def _write_records(path: str, record: struct.Struct, records) -> None:
+    pack = record.pack
+    with open(path, "wb", buffering=READ_AHEAD) as file:
+        batch: List[bytes] = []
+        for fields in records:
+            batch.append(pack(*fields))
+            if len(batch) == WRITE_BATCH:
+                file.write(b"".join(batch))
+                batch.clear()
+        file.write(b"".join(batch))
+
+
+def _merge_runs(paths: List[str], output_path: str, record: struct.Struct, buffer_size: int) -> None:
+    streams = [_read_records(path, record, buffer_size) for path in paths]
+    _write_records(output_path, record, merge(*streams))
+
+
+def external_sort(
+    input_path: str,
+    output_path: str,
+    record_format: str = "<q",
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    read_ahead: int = READ_AHEAD,
+    max_fan_in: int = MAX_FAN_IN,
+) -> None:
+    """Sort the fixed-width records of input_path into output_path using bounded memory."""
+    if max_fan_in < 2:
+        raise ValueError("max_fan_in must be at least 2")
+    record = struct.Struct(record_format)
+    if os.path.getsize(input_path) % record.size:
+        raise ValueError(f"File size is not a multiple of the record size ({record.size} bytes)")
+
+    # Python tuples take several times the space of the packed records, so the
+    # chunk read from disk is a fraction of the memory limit.
+    chunk_records = max(1, memory_limit // (record.size * 8))
+    chunk_bytes = chunk_records * record.size
+    read_ahead -= read_ahead % record.size
+    read_ahead = max(read_ahead, record.size)
+
+    with tempfile.TemporaryDirectory(dir=os.path.dirname(os.path.abspath(output_path))) as run_dir:
+        runs: List[str] = []
+        with open(input_path, "rb", buffering=0) as file:
+            while True:
+                block = file.read(chunk_bytes)
+                if not block:
+                    break
+                run_path = os.path.join(run_dir, f"run-{len(runs)}.bin")
+                _write_records(run_path, record, merge_sort(list(record.iter_unpack(block))))
+                runs.append(run_path)
+
+        if not runs:
+            open(output_path, "wb").close()
+            return
+        if len(runs) == 1:
+            os.replace(runs[0], output_path)
+            return
+
+        # Every open run keeps its own read-ahead buffer, which is what bounds the merge phase.
+        fan_in = min(len(runs), max_fan_in)
+        buffer_size = max(record.size, min(read_ahead, memory_limit // fan_in // 2))
+        buffer_size -= buffer_size % record.size
+
+        next_run = len(runs)
+        while len(runs) > max_fan_in:
+            merged: List[str] = []
+            for i in range(0, len(runs), max_fan_in):
+                group = runs[i:i + max_fan_in]
+                if len(group) == 1:
+                    merged.append(group[0])
+                    continue
+                run_path = os.path.join(run_dir, f"run-{next_run}.bin")
+                next_run += 1
+                _merge_runs(group, run_path, record, buffer_size)
+                for path in group:
+                    os.remove(path)
+                merged.append(run_path)
+            runs = merged
+
+        _merge_runs(runs, output_path, record, buffer_size)
+
+
+if __name__ == "__main__":
+    import random
+    from array import array
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "input.bin")
+        target = os.path.join(tmp, "output.bin")
+        nums = array("q", (random.randrange(-10**9, 10**9) for _ in range(100_000)))
+        with open(source, "wb") as f:
+            nums.tofile(f)
+
+        external_sort(source, target, "<q", memory_limit=256 * 1024)
+        many_runs = os.path.join(tmp, "many_runs.bin")
+        external_sort(source, many_runs, "<q", memory_limit=16 * 1024, max_fan_in=4)
+
+        result = array("q")
+        with open(target, "rb") as f:
+            result.frombytes(f.read())
+        print(list(result) == sorted(nums))  # True
+        with open(many_runs, "rb") as f:
+            print(f.read() == result.tobytes())  # True
@@ -4,26 +4,51 @@
 ### Description
 Insertion sort is a simple sorting algorithm that builds the final sorted array one item at a time.
 and it is efficient for small data sets. The time complexity of insertion sort is O(n^2) in the worst case.
+
+Both versions first compare the new item with the last sorted one, so already sorted input
+takes a single pass. Binary insertion sort finds the insertion point by binary search
+(the rightmost one, which keeps the sort stable) and shifts the tail with one slice
+assignment, so it makes O(n log n) comparisons in total.
 """
 
-from typing import List, Callable
+from bisect import bisect_right
+from typing import List, Callable, Optional
+
+from sorts.keys import decorate, undecorate
 
 
-def insertion_sort(arr: List[any], key: Callable[[any, any], bool] = lambda x, y: x < y) -> List[any]:
+def insertion_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
     """Sort the array using insertion sort."""
-    new_arr = arr.copy()
-    
+    new_arr = decorate(arr, key, reverse)
+
     n = len(new_arr)
     for i in range(1, n):
-        key = new_arr[i]
+        current = new_arr[i]
         j = i - 1
-        while j >= 0 and not key(new_arr[j], key):
+        while j >= 0 and current < new_arr[j]:
             new_arr[j + 1] = new_arr[j]
             j -= 1
-        new_arr[j + 1] = key
-    return new_arr
+        new_arr[j + 1] = current
+    return undecorate(new_arr, key, reverse)
+
+
+def binary_insertion_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
+    """Sort the array using insertion sort with a binary search for the insertion point."""
+    new_arr = decorate(arr, key, reverse)
+
+    n = len(new_arr)
+    for i in range(1, n):
+        current = new_arr[i]
+        if not current < new_arr[i - 1]:
+            continue
+
+        pos = bisect_right(new_arr, current, 0, i - 1)
+        new_arr[pos + 1:i + 1] = new_arr[pos:i]
+        new_arr[pos] = current
+    return undecorate(new_arr, key, reverse)
 
 
 if __name__ == "__main__":
     nums = [64, 34, 25, 12, 22, 11, 90]
     print(insertion_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
+    print(binary_insertion_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
@@ -0,0 +1,65 @@
+"""
+## Sort Keys
+
+### Description
+The sorts in this package follow the calling convention of the built-in `sorted`:
+`key` extracts a comparison key from every element and `reverse` sorts in descending order.
+
+Keys are computed once per element (decorate-sort-undecorate): every element is replaced by
+a (key, index, element) tuple, the algorithm compares the tuples with the native `<`, and the
+elements are taken back out at the end. The index breaks ties, so elements themselves are never
+compared and equal keys keep their input order. Descending order is produced by sorting the
+reversed input and reversing the result, which keeps equal keys in their input order as well.
+
+Old-style less-than comparators can still be used by wrapping them with `less_to_key`.
+The wrapped keys never compare equal to each other, so the index does not break their ties;
+the stable sorts still keep tied elements in input order.
+
+### Example
+```python
+from sorts.merge_sort import merge_sort
+from sorts.keys import less_to_key
+
+merge_sort(words, key=len)
+merge_sort(words, key=less_to_key(lambda x, y: len(x) < len(y)))
+```
+"""
+
+from typing import Any, Callable, List, Optional
+
+
+def less_to_key(less: Callable[[Any, Any], bool]) -> Callable[[Any], Any]:
+    """Convert a less-than comparator into a key function (like functools.cmp_to_key)."""
+
+    class Key:
+        __slots__ = ("value",)
+
+        def __init__(self, value: Any):
+            self.value = value
+
+        def __lt__(self, other: "Key") -> bool:
+            return less(self.value, other.value)
+
+        def __gt__(self, other: "Key") -> bool:
+            return less(other.value, self.value)
+
+        __hash__ = None
+
+    return Key
+
+
+def decorate(arr: List[Any], key: Optional[Callable[[Any], Any]], reverse: bool) -> List[Any]:
+    """Return a new list to sort: reversed if reverse is set, elements as (key, index, element) if key is set."""
+    items = arr[::-1] if reverse else list(arr)
+    if key is None:
+        return items
+    return [(key(x), i, x) for i, x in enumerate(items)]
+
+
+def undecorate(items: List[Any], key: Optional[Callable[[Any], Any]], reverse: bool) -> List[Any]:
+    """Undo decorate on a sorted list, in place when possible."""
+    if key is not None:
+        items = [item[2] for item in items]
+    if reverse:
+        items.reverse()
+    return items
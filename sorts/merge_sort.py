@@ -5,36 +5,79 @@
 Merge sort is a divide-and-conquer algorithm that divides the input array into two halves,
 recursively sorts the two halves, and then merges the sorted halves. The time complexity
 of merge sort is O(n log n) in the worst case.
+
+Natural merge sort skips the splitting step: it scans the input for runs that are already
+ascending (or strictly descending, which are reversed in place) and merges neighbouring runs
+until one is left. Input made of r runs takes O(n log r) time, so sorted input is O(n).
 """
 
-from typing import List, Callable
+from typing import List, Callable, Optional
+
+from sorts.keys import decorate, undecorate
 
 
-def merge_sort(arr: List[any], key: Callable[[any, any], bool] = lambda x, y: x < y) -> List[any]:
+def merge_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
     """Sort the array using merge sort."""
+    return undecorate(_merge_sort(decorate(arr, key, reverse)), key, reverse)
+
+
+def _merge_sort(arr: List[any]) -> List[any]:
     if len(arr) <= 1:
         return arr
-    
+
     mid = len(arr) // 2
-    left = merge_sort(arr[:mid], key)
-    right = merge_sort(arr[mid:], key)
-    
+    left = _merge_sort(arr[:mid])
+    right = _merge_sort(arr[mid:])
+    return _merge(left, right)
+
+
+def _merge(left: List[any], right: List[any]) -> List[any]:
     i, j = 0, 0
     sorted_arr = []
     while i < len(left) and j < len(right):
-        if key(left[i], right[j]):
-            sorted_arr.append(left[i])
-            i += 1
-        else:
+        if right[j] < left[i]:
             sorted_arr.append(right[j])
             j += 1
-    
+        else:
+            sorted_arr.append(left[i])
+            i += 1
+
     sorted_arr += left[i:]
     sorted_arr += right[j:]
-    
+
     return sorted_arr
 
 
+def natural_merge_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
+    """Sort the array by merging the ascending and descending runs already present in it."""
+    items = decorate(arr, key, reverse)
+    n = len(items)
+    runs = []
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and items[j] < items[j - 1]:
+            while j < n and items[j] < items[j - 1]:
+                j += 1
+            runs.append(items[i:j][::-1])
+        else:
+            while j < n and not items[j] < items[j - 1]:
+                j += 1
+            runs.append(items[i:j])
+        i = j
+
+    if not runs:
+        return []
+    while len(runs) > 1:
+        merged = [_merge(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return undecorate(runs[0], key, reverse)
+
+
 if __name__ == "__main__":
     nums = [64, 34, 25, 12, 22, 11, 90]
     print(merge_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
+    print(natural_merge_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
+    print(merge_sort(["pear", "fig", "banana"], key=len, reverse=True))  # ['banana', 'pear', 'fig']
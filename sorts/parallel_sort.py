@@ -0,0 +1,156 @@
+"""
+## Parallel Sort
+
+### Description
+Parallel sort is a sample sort by regular sampling over a process pool. The keys are copied
+once into a `multiprocessing.shared_memory` block; workers attach to the block by name, so no
+key data is pickled between processes. It works in two parallel phases:
+- Every worker sorts one chunk of the keys in place and returns evenly spaced samples of it.
+- The parent picks p - 1 splitters from the samples and cuts every sorted chunk at them with
+  a binary search. Worker j then merges the j-th piece of every chunk, which holds all keys
+  between splitters j - 1 and j, and writes the result straight to its place in a second
+  shared block.
+
+The sorting and merging run in the workers; the parent only sorts the p * p samples and cuts
+the chunks with p * (p - 1) binary searches. Three O(n) steps stay serial in the parent:
+checking the key types (_typecode), copying the keys into shared memory and reading the sorted
+block back into a list. With regular sampling no bucket holds more than about 2n / p keys, so
+the time complexity is O(n log n / p + n) for p workers.
+
+Small inputs, inputs with a key function, single-worker runs and inputs that are not all ints
+(that fit in 64 bits) or all floats fall back to the serial merge sort: starting processes costs
+far more than sorting a few thousand elements, key functions cannot be shipped to the workers,
+and mixed ints and floats cannot share one array without changing their type or precision.
+"""
+
+import os
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from heapq import merge
+from multiprocessing import shared_memory
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from sorts.merge_sort import merge_sort
+
+
+PARALLEL_CUTOFF = 1 << 16
+
+Number = Union[int, float]
+
+
+def _typecode(arr: List[Number]) -> Optional[str]:
+    """Return the array typecode that holds every key unchanged, or None if there is none."""
+    if all(type(x) is int for x in arr):
+        if -(1 << 63) <= min(arr) and max(arr) < (1 << 63):
+            return "q"
+        return None
+    if all(type(x) is float for x in arr):
+        return "d"
+    return None
+
+
+@contextmanager
+def _shared_array(typecode: str, name: Optional[str] = None, length: int = 0):
+    """
+    Attach to the named shared memory block, or create one of length items, and yield
+    (name, typed view). The view is always released before the block is closed, and a block
+    created here is unlinked even if closing it fails.
+    """
+    if name is None:
+        shm = shared_memory.SharedMemory(create=True, size=length * array(typecode).itemsize)
+    else:
+        shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            yield shm.name, view
+        finally:
+            view.release()
+    finally:
+        try:
+            shm.close()
+        finally:
+            if name is None:
+                shm.unlink()
+
+
+def _sort_chunk(name: str, typecode: str, start: int, stop: int, samples: int) -> List[Number]:
+    """Sort view[start:stop] in place and return `samples` evenly spaced keys of it."""
+    with _shared_array(typecode, name) as (_, view):
+        run = merge_sort(view[start:stop].tolist())
+        view[start:stop] = array(typecode, run)
+    return [run[len(run) * i // samples] for i in range(samples)] if run else []
+
+
+def _merge_bucket(source: str, target: str, typecode: str,
+                  pieces: Sequence[Tuple[int, int]], offset: int) -> None:
+    """Merge the sorted source pieces into target[offset:]."""
+    with _shared_array(typecode, source) as (_, keys):
+        runs = [keys[start:stop].tolist() for start, stop in pieces]
+    bucket = array(typecode, merge(*runs))
+    with _shared_array(typecode, target) as (_, out):
+        out[offset:offset + len(bucket)] = bucket
+
+
+def parallel_sort(
+    arr: List[Number],
+    workers: Optional[int] = None,
+    cutoff: int = PARALLEL_CUTOFF,
+    key: Optional[Callable[[any], any]] = None,
+    reverse: bool = False,
+) -> List[Number]:
+    """Sort a list of ints or floats using a process pool."""
+    workers = workers or os.cpu_count() or 1
+    n = len(arr)
+    if n < cutoff or workers <= 1 or key is not None:
+        return merge_sort(arr, key, reverse)
+
+    typecode = _typecode(arr)
+    if typecode is None:
+        return merge_sort(arr, key, reverse)
+
+    bounds = [n * i // workers for i in range(workers + 1)]
+    with _shared_array(typecode, length=n) as (source, keys), \
+            _shared_array(typecode, length=n) as (target, out), \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        keys[:] = array(typecode, arr)
+
+        futures = [
+            pool.submit(_sort_chunk, source, typecode, bounds[i], bounds[i + 1], workers)
+            for i in range(workers)
+        ]
+        samples = merge_sort([sample for future in futures for sample in future.result()])
+        splitters = samples[workers::workers][:workers - 1]
+
+        # cuts[i][j] is where bucket j starts in chunk i; every bucket is one piece per chunk.
+        cuts = [
+            [bounds[i]] + [bisect_right(keys, s, bounds[i], bounds[i + 1]) for s in splitters] + [bounds[i + 1]]
+            for i in range(workers)
+        ]
+        futures = []
+        offset = 0
+        for j in range(len(splitters) + 1):
+            pieces = [(chunk[j], chunk[j + 1]) for chunk in cuts if chunk[j] < chunk[j + 1]]
+            futures.append(pool.submit(_merge_bucket, source, target, typecode, pieces, offset))
+            offset += sum(stop - start for start, stop in pieces)
+        for future in futures:
+            future.result()
+
+        sorted_arr = out.tolist()
+
+    if reverse:
+        sorted_arr.reverse()
+    return sorted_arr
+
+
+if __name__ == "__main__":
+    import random
+
+    nums = [random.randrange(1_000_000) for _ in range(200_000)]
+    print(parallel_sort(nums, workers=4) == sorted(nums))  # True
+    print(parallel_sort([64, 34, 25, 12, 22, 11, 90]))  # [11, 12, 22, 25, 34, 64, 90]
+
+    mixed = [2 ** 53 + 1, 0.5] * (PARALLEL_CUTOFF // 2)
+    print(parallel_sort(mixed, workers=4)[-1])  # 9007199254740993
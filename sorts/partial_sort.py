@@ -0,0 +1,124 @@
+"""
+## Partial Sorts
+
+### Description
+Partial sorts answer "the first k results" without paying for a full O(n log n) sort.
+- nth_element places the k-th smallest element at index k, with smaller-or-equal elements
+  before it and greater-or-equal elements after it. It uses introselect: quickselect with
+  random pivots and three-way partitioning, falling back to merge sort if the recursion
+  depth grows past 2 log n, so it is O(n) on average.
+- partial_sort returns the k smallest elements in order in O(n + k log k) on average.
+- sorted_iter lazily yields the elements in order using incremental quicksort, so
+  consuming the first k elements costs O(n + k log k) on average.
+
+With reverse=True "smallest" becomes "largest". The items are decorated like in the other
+sorts (see sorts.keys), but instead of reversing the result the comparison itself is flipped,
+because only the first k positions are ever put in order.
+"""
+
+import random
+import operator
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from sorts.keys import decorate, undecorate
+from sorts.merge_sort import _merge_sort
+
+
+def _partition(arr: List[any], lo: int, hi: int, before: Callable[[any, any], bool]) -> Tuple[int, int]:
+    """Three-way partition arr[lo:hi] around a random pivot.
+
+    Return (lt, gt) such that arr[lo:lt] comes before the pivot, arr[lt:gt] ties with it
+    and arr[gt:hi] comes after it.
+    """
+    pivot = arr[random.randrange(lo, hi)]
+    lt, i, gt = lo, lo, hi
+    while i < gt:
+        if before(arr[i], pivot):
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif before(pivot, arr[i]):
+            gt -= 1
+            arr[i], arr[gt] = arr[gt], arr[i]
+        else:
+            i += 1
+    return lt, gt
+
+
+def _sorted_run(arr: List[any], before: Callable[[any, any], bool]) -> List[any]:
+    run = _merge_sort(arr)
+    if before is operator.gt:
+        run.reverse()
+    return run
+
+
+def _select(arr: List[any], k: int, before: Callable[[any, any], bool]) -> None:
+    lo, hi = 0, len(arr)
+    depth_limit = 2 * len(arr).bit_length()
+    while hi - lo > 1:
+        if depth_limit == 0:
+            arr[lo:hi] = _sorted_run(arr[lo:hi], before)
+            return
+        depth_limit -= 1
+
+        lt, gt = _partition(arr, lo, hi, before)
+        if k < lt:
+            hi = lt
+        elif k >= gt:
+            lo = gt
+        else:
+            return
+
+
+def nth_element(arr: List[any], k: int, key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
+    """Return a copy of the array with the k-th smallest element at index k."""
+    if not 0 <= k < len(arr):
+        raise IndexError("Index out of range")
+    items = decorate(arr, key, reverse)
+    _select(items, k, operator.gt if reverse else operator.lt)
+    return undecorate(items, key, False)
+
+
+def partial_sort(arr: List[any], k: int, key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
+    """Return the k smallest elements of the array in sorted order."""
+    if k <= 0:
+        return []
+    before = operator.gt if reverse else operator.lt
+    items = decorate(arr, key, reverse)
+    if k < len(items):
+        _select(items, k - 1, before)
+    return undecorate(_sorted_run(items[:k], before), key, False)
+
+
+def sorted_iter(iterable: Iterable[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> Iterator[any]:
+    """Yield the elements of the iterable in sorted order, sorting only as far as it is consumed."""
+    before = operator.gt if reverse else operator.lt
+    arr = decorate(list(iterable), key, reverse)
+    idx = 0
+    # Exclusive upper bounds of the segments still to be emitted, nearest segment on top.
+    # A segment is marked done when all of its elements tie with each other.
+    stack = [(len(arr), False)]
+    while idx < len(arr):
+        hi, done = stack[-1]
+        if done or hi - idx <= 1:
+            stack.pop()
+            while idx < hi:
+                yield arr[idx] if key is None else arr[idx][2]
+                idx += 1
+            continue
+
+        lt, gt = _partition(arr, idx, hi, before)
+        stack.append((gt, True))
+        if lt > idx:
+            stack.append((lt, False))
+
+
+if __name__ == "__main__":
+    nums = [64, 34, 25, 12, 22, 11, 90]
+    print(nth_element(nums, 3)[3])  # 25
+    print(partial_sort(nums, 3))  # [11, 12, 22]
+    print(partial_sort(nums, 3, reverse=True))  # [90, 64, 34]
+    print(list(sorted_iter(nums)))  # [11, 12, 22, 25, 34, 64, 90]
+
+    first_page = sorted_iter(iter(nums))
+    print([next(first_page) for _ in range(2)])  # [11, 12]
@@ -8,23 +8,33 @@ greater than the pivot are on the right. It then recursively sorts the two parti
 complexity of quick sort is O(n log n) in the average case and O(n^2) in the worst case.
 """
 
-from typing import List, Callable
+from typing import List, Callable, Optional
 
+from sorts.keys import decorate, undecorate
 
-def quick_sort(arr: List[any], key: Callable[[any, any], bool] = lambda x, y: x < y) -> List[any]:
+
+def quick_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
     """Sort the array using quick sort."""
+    return undecorate(_quick_sort(decorate(arr, key, reverse)), key, reverse)
+
+
+def _quick_sort(arr: List[any]) -> List[any]:
     if len(arr) <= 1:
         return arr
-    
+
     pivot = arr[len(arr) // 2]
-    left = [x for x in arr if key(x, pivot)]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if key(pivot, x)]
-    
-    return quick_sort(left, key) + middle + quick_sort(right, key)
+    left, middle, right = [], [], []
+    for x in arr:
+        if x < pivot:
+            left.append(x)
+        elif pivot < x:
+            right.append(x)
+        else:
+            middle.append(x)
+
+    return _quick_sort(left) + middle + _quick_sort(right)
 
 
 if __name__ == "__main__":
     nums = [64, 34, 25, 12, 22, 11, 90]
     print(quick_sort(nums))  # [11, 12, 22, 25, 34, 64, 90]
-    
\ No newline at end of file
@@ -7,23 +7,25 @@ from the unsorted part of the array and puts it at the beginning. The time compl
 of selection sort is O(n^2) in the worst case.
 """
 
-from typing import List, Callable
+from typing import List, Callable, Optional
 
+from sorts.keys import decorate, undecorate
 
-def selection_sort(arr: List[any], key: Callable[[any, any], bool] = lambda x, y: x < y) -> List[any]:
+
+def selection_sort(arr: List[any], key: Optional[Callable[[any], any]] = None, reverse: bool = False) -> List[any]:
     """Sort the array using selection sort."""
-    new_arr = arr.copy()
+    new_arr = decorate(arr, key, reverse)
     n = len(new_arr)
-    
+
     for i in range(n - 1):
         min_idx = i
         for j in range(i + 1, n):
-            if not key(new_arr[min_idx], new_arr[j]):
+            if new_arr[j] < new_arr[min_idx]:
                 min_idx = j
-        
+
         new_arr[i], new_arr[min_idx] = new_arr[min_idx], new_arr[i]
-    
-    return new_arr
+
+    return undecorate(new_arr, key, reverse)
 
 
 if __name__ == "__main__":
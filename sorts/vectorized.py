@@ -0,0 +1,133 @@
+"""
+## Vectorized Sorts
+
+### Description
+NumPy-backed versions of the integer sorts for data that already lives in arrays.
+Instead of boxing every element into a Python int and comparing them one at a time,
+the work is done in bulk:
+- counting_sort counts keys with `np.bincount` and expands them with `np.repeat`.
+- radix_sort runs LSD passes over 16-bit digits, each pass a stable argsort of the digit.
+- The *argsort functions return the permutation indices instead of a sorted copy,
+  so the same order can be applied to other columns.
+- batched_sort / batched_argsort sort every row of a 2-D block in one call.
+
+NumPy is an optional dependency. The pure-Python sorts in this package do not import
+this module, and calling any function here without NumPy installed raises ImportError.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+
+RADIX_BITS = 16
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError("sorts.vectorized requires numpy (pip install numpy)")
+
+
+def _as_int_array(arr) -> "np.ndarray":
+    _require_numpy()
+    values = np.asarray(arr)
+    if values.ndim != 1:
+        raise ValueError("Expected a 1-D array")
+    if values.size and values.dtype.kind not in "iu" and not isinstance(arr, np.ndarray) \
+            and all(isinstance(x, int) for x in arr):
+        # NumPy infers float64 for Python ints that fit neither int64 nor uint64 together
+        # with the other values, which would lose precision.
+        try:
+            values = np.array(arr, dtype=np.int64)
+        except OverflowError:
+            try:
+                values = np.array(arr, dtype=np.uint64)
+            except OverflowError:
+                raise TypeError("Expected integers that fit in 64 bits") from None
+    if values.size and not np.issubdtype(values.dtype, np.integer):
+        raise TypeError("Expected an array of integers")
+    return values
+
+
+def _wide_dtype(values: "np.ndarray") -> type:
+    """Return the 64-bit integer type that holds every value of the array's dtype."""
+    return np.uint64 if np.issubdtype(values.dtype, np.unsignedinteger) else np.int64
+
+
+def counting_sort(arr) -> "np.ndarray":
+    """Sort an integer array using counting sort over the range [min, max]."""
+    values = _as_int_array(arr)
+    if values.size <= 1:
+        return values.copy()
+
+    wide = _wide_dtype(values)
+    min_val = wide(values.min())
+    counts = np.bincount((values.astype(wide) - min_val).astype(np.int64))
+    return np.repeat((np.arange(counts.size, dtype=wide) + min_val).astype(values.dtype), counts)
+
+
+def radix_argsort(arr) -> "np.ndarray":
+    """Return the stable permutation that sorts an integer array, using LSD radix sort."""
+    values = _as_int_array(arr)
+    if values.size <= 1:
+        return np.arange(values.size)
+
+    # Shift into the unsigned range so negative keys sort correctly; the subtraction
+    # wraps in uint64, which is exact because max - min always fits in 64 bits.
+    # Unsigned keys are already in range and must not pass through int64.
+    if _wide_dtype(values) is np.uint64:
+        keys = values.astype(np.uint64)
+        keys -= keys.min()
+    else:
+        signed = values.astype(np.int64)
+        keys = signed.view(np.uint64) - signed.min().view(np.uint64)
+    max_key = int(keys.max())
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+
+    perm = np.arange(values.size)
+    shift = 0
+    while shift == 0 or max_key >> shift:
+        digits = ((keys[perm] >> np.uint64(shift)) & mask).astype(np.uint16)
+        perm = perm[np.argsort(digits, kind="stable")]
+        shift += RADIX_BITS
+    return perm
+
+
+def radix_sort(arr) -> "np.ndarray":
+    """Sort an integer array using LSD radix sort."""
+    values = _as_int_array(arr)
+    return values[radix_argsort(values)]
+
+
+def argsort(arr) -> "np.ndarray":
+    """Return the stable permutation that sorts the array (any comparable dtype)."""
+    _require_numpy()
+    return np.argsort(np.asarray(arr), kind="stable")
+
+
+def batched_sort(block) -> "np.ndarray":
+    """Sort every row of a 2-D block independently."""
+    _require_numpy()
+    values = np.asarray(block)
+    if values.ndim != 2:
+        raise ValueError("Expected a 2-D block")
+    return np.sort(values, axis=1, kind="stable")
+
+
+def batched_argsort(block) -> "np.ndarray":
+    """Return, for every row of a 2-D block, the permutation that sorts that row."""
+    _require_numpy()
+    values = np.asarray(block)
+    if values.ndim != 2:
+        raise ValueError("Expected a 2-D block")
+    return np.argsort(values, axis=1, kind="stable")
+
+
+if __name__ == "__main__":
+    nums = np.array([64, 34, 25, 12, 22, 11, 90, -3])
+    print(counting_sort(nums))  # [-3 11 12 22 25 34 64 90]
+    print(radix_sort(nums))  # [-3 11 12 22 25 34 64 90]
+    print(radix_argsort(nums))  # [7 5 3 4 2 1 0 6]
+    print(radix_sort(np.array([2 ** 63 + 5, 1, 2 ** 64 - 1], dtype=np.uint64)))  # [1 9223372036854775813 18446744073709551615]
+    print(batched_sort(np.array([[3, 1, 2], [9, 7, 8]])))  # [[1 2 3] [7 8 9]]
@@ -0,0 +1,121 @@
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+
+from object_oriented_programming.write_ahead_log import (
+    DEPOSIT, LOG_FILE, SNAPSHOT_FILE, DurableLedger, WriteAheadLog, _HEADER, _pack_record,
+)
+
+
+class DurableLedgerRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.log_path = os.path.join(self.directory, LOG_FILE)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def write_history(self) -> int:
+        """Log some operations around a snapshot and return the log size."""
+        ledger = DurableLedger(self.directory, group_commit=4)
+        ledger.open_account("Alice", Decimal(100))
+        ledger.open_account("Bob")
+        ledger.transfer(Decimal(30), "Alice", "Bob")
+        ledger.snapshot()
+        ledger.deposit("Bob", Decimal("4.50"), "Refund")
+        ledger.withdraw("Alice", Decimal(10))
+        ledger.close()
+        return os.path.getsize(self.log_path)
+
+    def test_recovers_from_snapshot_and_log_tail(self):
+        self.write_history()
+
+        ledger = DurableLedger(self.directory)
+        self.assertEqual(ledger.accounts["Alice"].balance, Decimal("60.00"))
+        self.assertEqual(ledger.accounts["Bob"].balance, Decimal("34.50"))
+        # Only the records after the snapshot are replayed.
+        self.assertEqual(len(ledger.accounts["Bob"].transactions), 1)
+        ledger.close()
+
+    def test_torn_tail_is_truncated(self):
+        size = self.write_history()
+        record = _pack_record(DEPOSIT, 0, amount=500, payload=b"Lost in the crash")
+        with open(self.log_path, "ab") as log:
+            log.write(record[:_HEADER.size + 3])  # A record cut short by a crash
+
+        ledger = DurableLedger(self.directory)
+        self.assertEqual(os.path.getsize(self.log_path), size)
+        self.assertEqual(ledger.accounts["Alice"].balance, Decimal("60.00"))
+        self.assertEqual(ledger.accounts["Bob"].balance, Decimal("34.50"))
+
+        # New records follow the last good one and survive the next recovery.
+        ledger.deposit("Alice", Decimal(5))
+        ledger.close()
+        self.assertEqual(DurableLedger(self.directory).accounts["Alice"].balance, Decimal("65.00"))
+
+    def test_zeroed_tail_is_truncated(self):
+        size = self.write_history()
+        with open(self.log_path, "ab") as log:
+            log.write(b"\x00" * 100)
+
+        DurableLedger(self.directory).close()
+        self.assertEqual(os.path.getsize(self.log_path), size)
+
+    def test_corruption_before_the_end_raises(self):
+        self.write_history()
+        os.remove(os.path.join(self.directory, SNAPSHOT_FILE))
+        with open(self.log_path, "r+b") as log:
+            data = bytearray(log.read())
+            data[_HEADER.size + 1] ^= 0xFF  # Inside the first record
+            log.seek(0)
+            log.write(data)
+
+        with self.assertRaises(ValueError):
+            DurableLedger(self.directory)
+        self.assertEqual(os.path.getsize(self.log_path), len(data))
+
+    def test_torn_header_is_truncated(self):
+        size = self.write_history()
+        with open(self.log_path, "ab") as log:
+            log.write(_pack_record(DEPOSIT, 0, amount=500)[:_HEADER.size - 5])
+
+        DurableLedger(self.directory).close()
+        self.assertEqual(os.path.getsize(self.log_path), size)
+
+    def test_corrupt_length_before_the_end_raises(self):
+        ledger = DurableLedger(self.directory)
+        ledger.open_account("Alice", Decimal(100))
+        for _ in range(20):
+            ledger.deposit("Alice", Decimal(1))
+        ledger.close()
+
+        offsets = [0] + [end for end, *_ in WriteAheadLog.replay(self.log_path)]
+        size = os.path.getsize(self.log_path)
+        with open(self.log_path, "r+b") as log:
+            log.seek(offsets[2] + _HEADER.size - 1)  # High byte of the third record's length
+            log.write(b"\xff")
+
+        with self.assertRaises(ValueError):
+            DurableLedger(self.directory)
+        self.assertEqual(os.path.getsize(self.log_path), size)
+
+    def test_snapshot_every(self):
+        ledger = DurableLedger(self.directory, snapshot_every=3)
+        ledger.open_account("Alice", Decimal(100))
+        ledger.deposit("Alice", Decimal(1))
+        self.assertFalse(os.path.exists(os.path.join(self.directory, SNAPSHOT_FILE)))
+        ledger.withdraw("Alice", Decimal(2))
+        self.assertTrue(os.path.exists(os.path.join(self.directory, SNAPSHOT_FILE)))
+        ledger.deposit("Alice", Decimal(3))
+        ledger.close()
+
+        recovered = DurableLedger(self.directory)
+        self.assertEqual(recovered.accounts["Alice"].balance, Decimal("102.00"))
+        self.assertEqual(len(recovered.accounts["Alice"].transactions), 1)
+        recovered.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
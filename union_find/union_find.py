@@ -3,15 +3,17 @@
 
 ### Description
 Union Find is a data structure that keeps track of elements which are partitioned into disjoint sets.
-It uses path compression and union by rank to optimize the operations
-(the amortized time complexity is O(α(n)), where α(n) is the inverse Ackermann function).
+It uses path compression to optimize the operations
+(the amortized time complexity is O(log n) per operation).
 It supports two operations:
 - Find: Determine which set a particular element is in. It returns an element from that set that serves as its "representative".
 - Union: Join two sets into a single set.
 
 ### Operations
 - find(x: int) -> int: Return the representative of the set containing x.
-- union(x: int, y: int) -> None: Join the sets containing x and y.
+- union(x: int, y: int) -> bool: Join the sets containing x and y. Return False if they were already joined.
+
+find is iterative, so long parent chains never hit the recursion limit.
 
 ### Example
 ```python
@@ -35,17 +37,23 @@ class UnionFind:
         self.parent = list(range(n))
     
     def find(self, x: int) -> int:
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:  # Path compression
+            parent[x], x = root, parent[x]
+        return root
 
-    def union(self, x: int, y: int) -> None:
+    def union(self, x: int, y: int) -> bool:
         x_root = self.find(x)
         y_root = self.find(y)
-        
-        if x_root != y_root:
-            self.parent[x_root] = y_root
-            
+        if x_root == y_root:
+            return False
+
+        self.parent[x_root] = y_root
+        return True
+
 
 if __name__ == "__main__":
     UnionFind(5)